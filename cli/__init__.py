@@ -1,5 +1,5 @@
 """CLI package for EIA Storage Accrual Engine."""
 
-from .app import app
+from .app import main
 
-__all__ = ["app"]
+__all__ = ["main"]
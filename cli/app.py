@@ -1,140 +1,191 @@
 """CLI application for EIA Storage Accrual Engine."""
 
 import argparse
+import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, List, Optional
 from datetime import datetime
+from functools import lru_cache
 
-from eia_sa.config import settings
-from eia_sa.utils.logging import setup_logging, get_logger
-from eia_sa.ingest.eia_client import EIAClient
+# Heavy imports (settings, EIA client, pandas) are deferred to the handlers so
+# that --help and argparse errors return without loading them.
+logger = logging.getLogger("eia_sa.cli.app")
 
-# Initialize logging
-setup_logging()
-logger = get_logger(__name__)
 
-def create_parser():
-    """Create argument parser for CLI."""
+def _run_timestamp() -> str:
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+@lru_cache(maxsize=1)
+def _settings():
+    """Load settings on first use; only handlers that need them pay for it."""
+    from eia_sa.config import settings
+    return settings
+
+def _add_keep_raw_arg(p: argparse.ArgumentParser) -> None:
+    p.add_argument('--keep-raw-json', action='store_true',
+                   help='Also write the fetched records as JSONL next to the Parquet file')
+
+
+def _add_weekly_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument('--start', '-s', default=None, help='Start date (YYYY-MM-DD; default: DEFAULT_START_DATE)')
+    p.add_argument('--end', '-e', default=None, help='End date (YYYY-MM-DD; default: DEFAULT_END_DATE)')
+    p.add_argument('--regions', '-r', nargs='*', help='Specific regions to ingest')
+    p.add_argument('--concurrency', '-c', type=int, default=None,
+                   help='Concurrent page requests when results span several pages (default: 8, capped at 8)')
+    _add_keep_raw_arg(p)
+
+
+def _add_capacity_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument('--year', '-y', type=int, help='Year for capacity data')
+    _add_keep_raw_arg(p)
+
+
+def _add_gold_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument('--asof', help='As-of date (YYYY-MM-DD)')
+    p.add_argument('--weights', nargs=3, type=float, help='Estimator weights (A B C)')
+
+
+def _add_accruals_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument('--asof', help='As-of date (YYYY-MM-DD)')
+    p.add_argument('--wacog', type=float, help='WACOG per MMBtu (default: DEFAULT_WACOG_PER_MMBTU)')
+    p.add_argument('--tariff-fixed', type=float, help='Fixed monthly tariff (default: DEFAULT_TARIFF_FIXED_MONTHLY)')
+    p.add_argument('--tariff-inj', type=float, help='Injection tariff per MMBtu (default: DEFAULT_TARIFF_INJECTION)')
+    p.add_argument('--tariff-wd', type=float, help='Withdrawal tariff per MMBtu (default: DEFAULT_TARIFF_WITHDRAWAL)')
+    p.add_argument('--scenario-band', type=float, help='Scenario band (±X%%; default: DEFAULT_SCENARIO_BAND)')
+
+
+def _no_args(p: argparse.ArgumentParser) -> None:
+    pass
+
+
+# name -> (help, argument builder). Builders only run for the subcommand
+# being invoked; the rest are registered with their help text alone.
+SUBCOMMANDS = {
+    'ingest-weekly': ('Ingest weekly working gas storage data', _add_weekly_args),
+    'ingest-capacity': ('Ingest storage capacity data', _add_capacity_args),
+    'build-silver': ('Build silver layer tables', _no_args),
+    'build-gold': ('Build gold layer tables', _add_gold_args),
+    'calc-accruals': ('Calculate month-end accruals', _add_accruals_args),
+    'dashboard': ('Launch Streamlit dashboard', _no_args),
+    'status': ('Show system status', _no_args),
+}
+
+
+def create_parser(commands: Optional[Iterable[str]] = None):
+    """Create argument parser for CLI.
+
+    Only the subcommands in ``commands`` get their arguments registered; the
+    default (``None``) builds all of them. Parsers are cached per command
+    set, so treat the returned parser as read-only.
+    """
+    return _build_parser(None if commands is None else frozenset(commands))
+
+
+@lru_cache(maxsize=16)
+def _build_parser(commands: Optional[frozenset]) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="EIA Storage Accrual Engine - Production-grade natural gas storage analysis"
     )
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Ingest weekly command
-    weekly_parser = subparsers.add_parser('ingest-weekly', help='Ingest weekly working gas storage data')
-    weekly_parser.add_argument('--start', '-s', default=settings.default_start_date, help='Start date (YYYY-MM-DD)')
-    weekly_parser.add_argument('--end', '-e', default=settings.default_end_date, help='End date (YYYY-MM-DD)')
-    weekly_parser.add_argument('--regions', '-r', nargs='*', help='Specific regions to ingest')
-    
-    # Ingest capacity command
-    capacity_parser = subparsers.add_parser('ingest-capacity', help='Ingest storage capacity data')
-    capacity_parser.add_argument('--year', '-y', type=int, help='Year for capacity data')
-    
-    # Build silver command
-    silver_parser = subparsers.add_parser('build-silver', help='Build silver layer tables')
-    
-    # Build gold command
-    gold_parser = subparsers.add_parser('build-gold', help='Build gold layer tables')
-    gold_parser.add_argument('--asof', help='As-of date (YYYY-MM-DD)')
-    gold_parser.add_argument('--weights', nargs=3, type=float, help='Estimator weights (A B C)')
-    
-    # Calculate accruals command
-    accruals_parser = subparsers.add_parser('calc-accruals', help='Calculate month-end accruals')
-    accruals_parser.add_argument('--asof', help='As-of date (YYYY-MM-DD)')
-    accruals_parser.add_argument('--wacog', type=float, default=settings.default_wacog_per_mmbtu, help='WACOG per MMBtu')
-    accruals_parser.add_argument('--tariff-fixed', type=float, default=settings.default_tariff_fixed_monthly, help='Fixed monthly tariff')
-    accruals_parser.add_argument('--tariff-inj', type=float, default=settings.default_tariff_injection, help='Injection tariff per MMBtu')
-    accruals_parser.add_argument('--tariff-wd', type=float, default=settings.default_tariff_withdrawal, help='Withdrawal tariff per MMBtu')
-    accruals_parser.add_argument('--scenario-band', type=float, default=settings.default_scenario_band, help='Scenario band (±X%)')
-    
-    # Dashboard command
-    dashboard_parser = subparsers.add_parser('dashboard', help='Launch Streamlit dashboard')
-    
-    # Status command
-    status_parser = subparsers.add_parser('status', help='Show system status')
+    for name, (help_text, add_args) in SUBCOMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if commands is None or name in commands:
+            add_args(sub)
     
     return parser
 
 
-def ingest_weekly(start_date: str, end_date: str, regions: Optional[List[str]] = None):
-    """Ingest weekly working gas storage data from EIA API."""
+def ingest_weekly(start_date: str, end_date: str, regions: Optional[List[str]] = None,
+                  keep_raw_json: bool = False, run_ts: Optional[str] = None,
+                  concurrency: Optional[int] = None):
+    """Ingest weekly working gas storage data from EIA API.
+
+    ``run_ts`` stamps the output filenames; main() passes one per run.
+    """
     try:
-        logger.info("Starting weekly storage data ingestion", 
-                   start_date=start_date, end_date=end_date, regions=regions)
+        from eia_sa.ingest.eia_client import EIAClient, MAX_CONCURRENCY
+
+        logger.info("Starting weekly storage data ingestion: %s to %s, regions=%s",
+                    start_date, end_date, regions)
         
-        # Initialize EIA client
-        client = EIAClient()
+        # Initialize EIA client; the session is closed on exit
+        with EIAClient() as client:
+            # Fetch weekly storage data
+            df = client.fetch_weekly_storage(start_date, end_date, regions,
+                                             max_workers=concurrency or MAX_CONCURRENCY)
         
-        # Fetch weekly storage data
-        df = client.fetch_weekly_storage(start_date, end_date, regions)
+            if df.empty:
+                logger.error("No weekly storage data retrieved")
+                sys.exit(1)
         
-        if df.empty:
-            logger.error("No weekly storage data retrieved")
-            sys.exit(1)
+            # One stem for every file this ingest writes
+            stem = f"weekly_storage_{start_date}_{end_date}_{run_ts or _run_timestamp()}"
         
-        # Save raw data
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        client.save_raw_data(
-            {"response": {"data": df.to_dict('records')}}, 
-            f"weekly_storage_{start_date}_{end_date}_{timestamp}"
-        )
+            # Parquet keeps the records losslessly; the JSONL copy is opt-in
+            if keep_raw_json:
+                client.save_raw_records(df, stem)
         
-        # Save parquet data
-        client.save_parquet_data(
-            df, 
-            f"weekly_storage_{start_date}_{end_date}_{timestamp}"
-        )
+            # Save parquet data
+            client.save_parquet_data(df, stem)
         
-        # Generate summary
-        summary = client.get_data_summary(df)
-        logger.info("Weekly storage ingestion complete", summary=summary)
+            # Generate summary
+            summary = client.get_data_summary(df)
+            logger.info("Weekly storage ingestion complete: %s", summary)
         
         print(f"✅ Successfully ingested {summary['record_count']} weekly storage records")
         print(f"📊 Date range: {summary['date_range']}")
         print(f"🌍 Regions: {summary['regions']}")
         
     except Exception as e:
-        logger.error("Weekly storage ingestion failed", error=str(e))
+        logger.error("Weekly storage ingestion failed: %s", e)
         print(f"❌ Ingestion failed: {str(e)}")
         sys.exit(1)
 
 
-def ingest_capacity(year: Optional[int] = None):
-    """Ingest storage capacity data from EIA API."""
+def ingest_capacity(year: Optional[int] = None, keep_raw_json: bool = False,
+                    run_ts: Optional[str] = None):
+    """Ingest storage capacity data from EIA API.
+
+    ``run_ts`` stamps the output filenames; main() passes one per run.
+    """
     try:
-        logger.info("Starting capacity data ingestion", year=year)
+        from eia_sa.ingest.eia_client import EIAClient
+
+        logger.info("Starting capacity data ingestion: year=%s", year)
         
-        # Initialize EIA client
-        client = EIAClient()
+        # Initialize EIA client; the session is closed on exit
+        with EIAClient() as client:
+            # Fetch capacity data
+            df = client.fetch_capacity_data(year)
         
-        # Fetch capacity data
-        df = client.fetch_capacity_data(year)
+            if df.empty:
+                logger.error("No capacity data retrieved")
+                sys.exit(1)
         
-        if df.empty:
-            logger.error("No capacity data retrieved")
-            sys.exit(1)
+            # One stem for every file this ingest writes
+            year_str = str(year) if year else "current"
+            stem = f"capacity_{year_str}_{run_ts or _run_timestamp()}"
         
-        # Save raw data
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        year_str = str(year) if year else "current"
-        client.save_raw_data(
-            {"response": {"data": df.to_dict('records')}}, 
-            f"capacity_{year_str}_{timestamp}"
-        )
+            # Parquet keeps the records losslessly; the JSONL copy is opt-in
+            if keep_raw_json:
+                client.save_raw_records(df, stem)
         
-        # Save parquet data
-        client.save_parquet_data(df, f"capacity_{year_str}_{timestamp}")
+            # Save parquet data
+            client.save_parquet_data(df, stem)
         
-        # Generate summary
-        summary = client.get_data_summary(df)
-        logger.info("Capacity ingestion complete", summary=summary)
+            # Generate summary
+            summary = client.get_data_summary(df)
+            logger.info("Capacity ingestion complete: %s", summary)
         
         print(f"✅ Successfully ingested {summary['record_count']} capacity records")
         print(f"📊 Year: {year_str}")
         
     except Exception as e:
-        logger.error("Capacity ingestion failed", error=str(e))
+        logger.error("Capacity ingestion failed: %s", e)
         print(f"❌ Ingestion failed: {str(e)}")
         sys.exit(1)
 
@@ -150,7 +201,7 @@ def build_silver():
         print("💡 This will normalize weekly storage and capacity data")
         
     except Exception as e:
-        logger.error("Silver layer build failed", error=str(e))
+        logger.error("Silver layer build failed: %s", e)
         print(f"❌ Build failed: {str(e)}")
         sys.exit(1)
 
@@ -158,7 +209,7 @@ def build_silver():
 def build_gold(asof: Optional[str] = None, weights: Optional[List[float]] = None):
     """Build gold layer tables from silver data."""
     try:
-        logger.info("Starting gold layer build", asof=asof, weights=weights)
+        logger.info("Starting gold layer build: asof=%s, weights=%s", asof, weights)
         print(f"🔧 Building gold layer tables as of {asof}...")
         
         # TODO: Implement gold layer transformation
@@ -166,7 +217,7 @@ def build_gold(asof: Optional[str] = None, weights: Optional[List[float]] = None
         print("💡 This will create monthly rollforward and KPIs")
         
     except Exception as e:
-        logger.error("Gold layer build failed", error=str(e))
+        logger.error("Gold layer build failed: %s", e)
         print(f"❌ Build failed: {str(e)}")
         sys.exit(1)
 
@@ -174,24 +225,24 @@ def build_gold(asof: Optional[str] = None, weights: Optional[List[float]] = None
 def calc_accruals(asof: str, wacog: float = None, tariff_fixed: float = None, tariff_inj: float = None, tariff_wd: float = None, scenario_band: float = None):
     """Calculate month-end accruals."""
     try:
-        logger.info("Starting accrual calculation", 
-                   asof=asof, wacog=wacog, tariff_fixed=tariff_fixed,
-                   tariff_inj=tariff_inj, tariff_wd=tariff_wd,
-                   scenario_band=scenario_band)
-        
-        print(f"💰 Calculating accruals as of {asof}...")
-        print(f"📊 WACOG: ${wacog:.2f}/MMBtu")
-        print(f"💵 Fixed tariff: ${tariff_fixed:,.0f}/month")
-        print(f"📥 Injection tariff: ${tariff_inj:.3f}/MMBtu")
-        print(f"📤 Withdrawal tariff: ${tariff_wd:.3f}/MMBtu")
-        print(f"📈 Scenario band: ±{scenario_band:.1%}")
+        logger.info("Starting accrual calculation: asof=%s, wacog=%s, tariff_fixed=%s, "
+                    "tariff_inj=%s, tariff_wd=%s, scenario_band=%s",
+                    asof, wacog, tariff_fixed, tariff_inj, tariff_wd, scenario_band)
         
-        # TODO: Implement accrual calculation
-        print("⚠️  Accrual calculation not yet implemented")
-        print("💡 This will calculate inventory + storage fees")
+        sys.stdout.write(
+            f"💰 Calculating accruals as of {asof}...\n"
+            f"📊 WACOG: ${wacog:.2f}/MMBtu\n"
+            f"💵 Fixed tariff: ${tariff_fixed:,.0f}/month\n"
+            f"📥 Injection tariff: ${tariff_inj:.3f}/MMBtu\n"
+            f"📤 Withdrawal tariff: ${tariff_wd:.3f}/MMBtu\n"
+            f"📈 Scenario band: ±{scenario_band:.1%}\n"
+            # TODO: Implement accrual calculation
+            "⚠️  Accrual calculation not yet implemented\n"
+            "💡 This will calculate inventory + storage fees\n"
+        )
         
     except Exception as e:
-        logger.error("Accrual calculation failed", error=str(e))
+        logger.error("Accrual calculation failed: %s", e)
         print(f"❌ Calculation failed: {str(e)}")
         sys.exit(1)
 
@@ -207,7 +258,7 @@ def dashboard():
         print("💡 This will start the Streamlit app")
         
     except Exception as e:
-        logger.error("Dashboard launch failed", error=str(e))
+        logger.error("Dashboard launch failed: %s", e)
         print(f"❌ Launch failed: {str(e)}")
         sys.exit(1)
 
@@ -215,71 +266,173 @@ def dashboard():
 def status():
     """Show system status and configuration."""
     try:
+        settings = _settings()
         logger.info("Showing system status")
         
-        print("🔋 EIA Storage Accrual Engine - Status")
-        print("=" * 50)
-        
-        # Configuration
-        print("📋 Configuration:")
-        print(f"   EIA API Key: {'✅ Configured' if settings.eia_api_key else '❌ Not configured'}")
-        print(f"   Base URL: {settings.eia_base_url}")
-        print(f"   Data paths:")
-        print(f"     Bronze: {settings.data_bronze_path}")
-        print(f"     Gold: {settings.data_gold_path}")
-        print(f"     Outputs: {settings.outputs_path}")
-        
-        # Estimator weights
-        print(f"   Estimator weights: {settings.estimator_weights_dict}")
-        
-        # Check data files
-        print("\n📊 Data Status:")
+        # Collected and written once rather than one print per line
+        lines = [
+            "🔋 EIA Storage Accrual Engine - Status",
+            "=" * 50,
+            
+            # Configuration
+            "📋 Configuration:",
+            f"   EIA API Key: {'✅ Configured' if settings.eia_api_key else '❌ Not configured'}",
+            f"   Base URL: {settings.eia_base_url}",
+            "   Data paths:",
+            f"     Bronze: {settings.data_bronze_path}",
+            f"     Gold: {settings.data_gold_path}",
+            f"     Outputs: {settings.outputs_path}",
+            
+            # Estimator weights
+            f"   Estimator weights: {settings.estimator_weights_dict}",
+            
+            # Check data files
+            "\n📊 Data Status:",
+        ]
         bronze_path = Path(settings.data_bronze_path)
         if bronze_path.exists():
-            bronze_files = list(bronze_path.glob("*.parquet"))
-            print(f"   Bronze files: {len(bronze_files)}")
-            for f in bronze_files[:5]:  # Show first 5
-                print(f"     • {f.name}")
-            if len(bronze_files) > 5:
-                print(f"     ... and {len(bronze_files) - 5} more")
+            # Count everything but only keep names for the preview
+            preview, total = [], 0
+            with os.scandir(bronze_path) as it:
+                for entry in it:
+                    if entry.name.endswith(".parquet"):
+                        total += 1
+                        if len(preview) < 5:
+                            preview.append(entry.name)
+            lines.append(f"   Bronze files: {total}")
+            lines.extend(f"     • {name}" for name in preview)  # Show first 5
+            if total > 5:
+                lines.append(f"     ... and {total - 5} more")
         else:
-            print("   Bronze files: No data directory found")
+            lines.append("   Bronze files: No data directory found")
         
-        print("\n🎯 Ready for operations!")
+        lines.append("\n🎯 Ready for operations!\n")
+        sys.stdout.write("\n".join(lines))
         
     except Exception as e:
-        logger.error("Status check failed", error=str(e))
+        logger.error("Status check failed: %s", e)
         print(f"❌ Status check failed: {str(e)}")
         sys.exit(1)
 
 
-def main():
+# Option table for the fast path: flag -> (dest, type). A type of None marks
+# options the fast path does not handle (nargs); those go through argparse.
+# bool marks store_true switches.
+_FAST_SPEC = {
+    'ingest-weekly': {
+        '--start': ('start', str), '-s': ('start', str),
+        '--end': ('end', str), '-e': ('end', str),
+        '--regions': ('regions', None), '-r': ('regions', None),
+        '--concurrency': ('concurrency', int), '-c': ('concurrency', int),
+        '--keep-raw-json': ('keep_raw_json', bool),
+    },
+    'ingest-capacity': {
+        '--year': ('year', int), '-y': ('year', int),
+        '--keep-raw-json': ('keep_raw_json', bool),
+    },
+    'build-silver': {},
+    'build-gold': {'--asof': ('asof', str), '--weights': ('weights', None)},
+    'calc-accruals': {
+        '--asof': ('asof', str),
+        '--wacog': ('wacog', float),
+        '--tariff-fixed': ('tariff_fixed', float),
+        '--tariff-inj': ('tariff_inj', float),
+        '--tariff-wd': ('tariff_wd', float),
+        '--scenario-band': ('scenario_band', float),
+    },
+    'dashboard': {},
+    'status': {},
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parse ``<cmd> [--flag value ...]`` without building an argparse tree.
+
+    Returns None for anything outside that shape (help, unknown tokens,
+    nargs options, missing or bad values) so the caller can fall back to
+    argparse, which owns all help and error reporting.
+    """
+    if not argv or argv[0] not in _FAST_SPEC:
+        return None
+    spec = _FAST_SPEC[argv[0]]
+    values = {dest: (False if typ is bool else None) for dest, typ in spec.values()}
+    tokens = iter(argv[1:])
+    for flag in tokens:
+        opt = spec.get(flag)
+        if opt is None or opt[1] is None:
+            return None
+        if opt[1] is bool:
+            values[opt[0]] = True
+            continue
+        raw = next(tokens, None)
+        if raw is None:
+            return None
+        try:
+            values[opt[0]] = opt[1](raw)
+        except ValueError:
+            return None
+    return argparse.Namespace(command=argv[0], **values)
+
+
+def _run_ingest_weekly(args):
+    settings = _settings()
+    start = args.start if args.start is not None else settings.default_start_date
+    end = args.end if args.end is not None else settings.default_end_date
+    ingest_weekly(start, end, args.regions, args.keep_raw_json, args.run_ts,
+                  args.concurrency)
+
+
+def _run_calc_accruals(args):
+    settings = _settings()
+    calc_accruals(
+        args.asof,
+        args.wacog if args.wacog is not None else settings.default_wacog_per_mmbtu,
+        args.tariff_fixed if args.tariff_fixed is not None else settings.default_tariff_fixed_monthly,
+        args.tariff_inj if args.tariff_inj is not None else settings.default_tariff_injection,
+        args.tariff_wd if args.tariff_wd is not None else settings.default_tariff_withdrawal,
+        args.scenario_band if args.scenario_band is not None else settings.default_scenario_band,
+    )
+
+
+HANDLERS = {
+    'ingest-weekly': _run_ingest_weekly,
+    'ingest-capacity': lambda args: ingest_capacity(args.year, args.keep_raw_json, args.run_ts),
+    'build-silver': lambda args: build_silver(),
+    'build-gold': lambda args: build_gold(args.asof, args.weights),
+    'calc-accruals': _run_calc_accruals,
+    'dashboard': lambda args: dashboard(),
+    'status': lambda args: status(),
+}
+
+
+def main(argv: Optional[List[str]] = None):
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        # Top-level help only needs command names; nothing else is loaded
+        create_parser(()).print_help()
+        sys.exit(0 if argv else 1)
     
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
+    args = _fast_parse(argv)
+    if args is None:
+        # Only the invoked subcommand needs its arguments; help and usage
+        # errors are served from the name/help stubs.
+        command = argv[0] if argv and argv[0] in SUBCOMMANDS else None
+        parser = create_parser((command,) if command else ())
+        args = parser.parse_args(argv)
+        
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
+    
+    from eia_sa.utils.logging import setup_logging
+    setup_logging()
+    
+    # One stamp per run keeps every file written by this invocation aligned
+    args.run_ts = _run_timestamp()
     
     try:
-        if args.command == 'ingest-weekly':
-            ingest_weekly(args.start, args.end, args.regions)
-        elif args.command == 'ingest-capacity':
-            ingest_capacity(args.year)
-        elif args.command == 'build-silver':
-            build_silver()
-        elif args.command == 'build-gold':
-            build_gold(args.asof, args.weights)
-        elif args.command == 'calc-accruals':
-            calc_accruals(args.asof, args.wacog, args.tariff_fixed, args.tariff_inj, args.tariff_wd, args.scenario_band)
-        elif args.command == 'dashboard':
-            dashboard()
-        elif args.command == 'status':
-            status()
-        else:
-            print(f"Unknown command: {args.command}")
-            sys.exit(1)
+        HANDLERS[args.command](args)
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled by user")
         sys.exit(1)
@@ -1,11 +1,14 @@
 """Streamlit dashboard for EIA Storage Accrual Engine."""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 # Page configuration
 st.set_page_config(
@@ -37,6 +40,72 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def _make_template_fig() -> go.Figure:
+    """Storage trend figure with styling and layout; callers copy it before filling traces."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        mode='lines+markers',
+        name='Working Gas',
+        line=dict(color='#1f77b4', width=2)
+    ))
+    fig.add_trace(go.Scatter(
+        mode='lines',
+        name='5-Year Average',
+        line=dict(color='#ff7f0e', width=2, dash='dash')
+    ))
+    fig.add_trace(go.Scatter(
+        mode='lines',
+        name='Working Capacity',
+        line=dict(color='#d62728', width=2, dash='dot')
+    ))
+    fig.update_layout(
+        title="Natural Gas Storage Trend",
+        xaxis_title="Date",
+        yaxis_title="BCF",
+        hovermode='x unified',
+        height=500
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _storage_trend_figure(end_date, region: str, stratum: str) -> go.Figure:
+    """Storage trend chart for the overview tab, cached per sidebar selection."""
+    # Sample data for demonstration
+    dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='W')
+    i = np.arange(len(dates), dtype=np.int64)
+    series = {
+        'working_gas_bcf': 2000 + 10*i + 5*(i % 52),
+        'five_year_avg': 2100 + 8*i,
+        'capacity': np.full_like(i, 3000),
+    }
+    # A copy of the shared template; the cached resource itself is never mutated
+    fig = go.Figure(_make_template_fig())
+    x = dates.to_numpy()
+    for trace, col in zip(fig.data, ('working_gas_bcf', 'five_year_avg', 'capacity'), strict=True):
+        trace.x = x
+        trace.y = series[col]
+    return fig
+
+# st.fragment arrived in Streamlit 1.37; older releases only have the
+# experimental name, or neither (then the metrics rerun with the page).
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda f: f)
+
+@st.cache_data(show_spinner=False)
+def _headline_metrics() -> dict[str, tuple[str, str]]:
+    """Formatted (value, delta) for each headline metric."""
+    return {
+        "End Working Gas": ("2,847 BCF", "+45 BCF"),
+        "% of Capacity": ("78.2%", "-2.1%"),
+        "Z-Score vs 5Y": ("-0.3", "+0.1"),
+        "Total Accrual": ("$1.2M", "+$45K"),
+    }
+
+@_fragment
+def _render_metrics(metrics: dict[str, tuple[str, str]]) -> None:
+    for col, (label, (value, delta)) in zip(st.columns(len(metrics)), metrics.items(), strict=True):
+        col.metric(label=label, value=value, delta=delta)
+
 def main():
     """Main dashboard function."""
     
@@ -75,35 +144,7 @@ def main():
             st.rerun()
     
     # Main content
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="End Working Gas",
-            value="2,847 BCF",
-            delta="+45 BCF"
-        )
-    
-    with col2:
-        st.metric(
-            label="% of Capacity",
-            value="78.2%",
-            delta="-2.1%"
-        )
-    
-    with col3:
-        st.metric(
-            label="Z-Score vs 5Y",
-            value="-0.3",
-            delta="+0.1"
-        )
-    
-    with col4:
-        st.metric(
-            label="Total Accrual",
-            value="$1.2M",
-            delta="+$45K"
-        )
+    _render_metrics(_headline_metrics())
     
     # Tabs for different views
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📈 Rollforward", "💰 Accruals", "📋 KPIs"])
@@ -114,50 +155,7 @@ def main():
         # Placeholder for storage chart
         st.info("📈 Storage trend chart will be displayed here")
         
-        # Sample data for demonstration
-        dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='W')
-        sample_data = pd.DataFrame({
-            'date': dates,
-            'working_gas_bcf': [2000 + i*10 + (i % 52)*5 for i in range(len(dates))],
-            'five_year_avg': [2100 + i*8 for i in range(len(dates))],
-            'capacity': [3000] * len(dates)
-        })
-        
-        # Create storage chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=sample_data['date'],
-            y=sample_data['working_gas_bcf'],
-            mode='lines+markers',
-            name='Working Gas',
-            line=dict(color='#1f77b4', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=sample_data['date'],
-            y=sample_data['five_year_avg'],
-            mode='lines',
-            name='5-Year Average',
-            line=dict(color='#ff7f0e', width=2, dash='dash')
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=sample_data['date'],
-            y=sample_data['capacity'],
-            mode='lines',
-            name='Working Capacity',
-            line=dict(color='#d62728', width=2, dash='dot')
-        ))
-        
-        fig.update_layout(
-            title="Natural Gas Storage Trend",
-            xaxis_title="Date",
-            yaxis_title="BCF",
-            hovermode='x unified',
-            height=500
-        )
-        
+        fig = _storage_trend_figure(end_date, selected_region, selected_stratum)
         st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
@@ -203,7 +201,9 @@ def main():
         st.dataframe(sample_accruals, use_container_width=True)
         
         # Download button
-        csv = sample_accruals.to_csv(index=False)
+        buf = pa.BufferOutputStream()
+        pcsv.write_csv(pa.Table.from_pandas(sample_accruals, preserve_index=False), buf)
+        csv = buf.getvalue().to_pybytes()
         st.download_button(
             label="📥 Download Accruals CSV",
             data=csv,
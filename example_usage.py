@@ -3,11 +3,13 @@
 Simple example of using the EIA Energy Analyzer
 """
 
+import logging
 from eia_analysis import EIAEnergyAnalyzer
 import os
 
 def main():
     """Demonstrate basic EIA analysis functionality"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🔋 EIA Energy Analysis - Simple Example")
     print("=" * 50)
     
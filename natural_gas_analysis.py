@@ -3,18 +3,83 @@
 Comprehensive Natural Gas Analysis using EIA API
 """
 
-from eia_analysis import EIAEnergyAnalyzer
+import logging
+from eia_analysis import EIAEnergyAnalyzer, _parse_periods
+import numpy as np
 import pandas as pd
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
 import os
+import time
 
-def analyze_natural_gas_storage():
-    """Analyze natural gas storage data"""
+# Cleaned storage frame from the last run; reused while it is fresher than
+# this, only when caching is turned on (use_cache=True or EIA_CLEAN_CACHE=1)
+CLEAN_CACHE = os.path.join("cache", "storage_clean.parquet")
+CLEAN_CACHE_MAX_AGE = 24 * 3600  # seconds
+
+# Line plots get at most this many points; denser series are reduced to a
+# per-bucket min/max envelope first
+MAX_PLOT_POINTS = 2000
+
+def _minmax_envelope(y, n_out=MAX_PLOT_POINTS):
+    """Indices of each bucket's min and max point, in order (all indices if already small)."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    starts = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)[:-1]
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    keep = []
+    for extreme in (np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)):
+        hits = np.flatnonzero(y == extreme[bucket])
+        # First hit per bucket
+        keep.append(hits[np.unique(bucket[hits], return_index=True)[1]])
+    return np.unique(np.concatenate(keep))
+
+def _calendar_fields(period):
+    """Year (Int16), month and ISO week (Int8) from datetime64 values.
+
+    Straight datetime64 unit arithmetic; avoids the temporary frame that
+    ``.dt.isocalendar()`` builds. NaT periods (unparseable ones, see
+    ``_parse_periods``) come back as <NA>, so groupbys leave them out.
+    """
+    nat = np.isnat(period)
+    days = period.astype('datetime64[D]')
+    months = days.astype('datetime64[M]').astype(np.int64)
+    # ISO week: the week's Thursday decides its year; 1970-01-01 was a Thursday
+    day_num = days.astype(np.int64)
+    thursday = day_num - (day_num + 3) % 7 + 3
+    iso_jan1 = thursday.astype('datetime64[D]').astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64)
+    return (pd.arrays.IntegerArray((months // 12 + 1970).astype(np.int16), nat),
+            pd.arrays.IntegerArray((months % 12 + 1).astype(np.int8), nat.copy()),
+            pd.arrays.IntegerArray(((thursday - iso_jan1) // 7 + 1).astype(np.int8), nat.copy()))
+
+def _with_calendar(storage_df):
+    """storage_df with year/month/week columns, derived from ``period`` when
+    the caller passed a plain period/value frame rather than a loaded one."""
+    if {'year', 'month', 'week'}.issubset(storage_df.columns):
+        return storage_df
+    year, month, week = _calendar_fields(pd.to_datetime(storage_df['period']).to_numpy())
+    return storage_df.assign(year=year, month=month, week=week)
+
+def analyze_natural_gas_storage(use_cache=None):
+    """Analyze natural gas storage data
+    
+    Args:
+        use_cache: Reuse/write the cleaned frame at CLEAN_CACHE; defaults to
+            the EIA_CLEAN_CACHE environment variable, off when unset
+    """
     print("🔋 Natural Gas Storage Analysis")
     print("=" * 50)
     
+    if use_cache is None:
+        use_cache = os.getenv('EIA_CLEAN_CACHE', '').lower() in ('1', 'true', 'yes')
+    if use_cache and os.path.exists(CLEAN_CACHE) and time.time() - os.path.getmtime(CLEAN_CACHE) < CLEAN_CACHE_MAX_AGE:
+        storage_df = pd.read_parquet(CLEAN_CACHE)
+        print(f"✅ Loaded {len(storage_df)} cleaned storage data points from {CLEAN_CACHE}")
+        return storage_df
+    
     # Initialize analyzer with API key from environment
     api_key = os.getenv('EIA_API_KEY')
     if not api_key:
@@ -47,11 +112,20 @@ def analyze_natural_gas_storage():
     storage_df = storage_df.dropna(subset=['value'])
     
     # Convert period to datetime
-    storage_df['period'] = pd.to_datetime(storage_df['period'])
+    storage_df['period'] = _parse_periods(storage_df['period'])
     
     # Sort by period
     storage_df = storage_df.sort_values('period')
     
+    # Compact dtypes: small nullable-int calendar fields, categorical labels (values stay float64)
+    for col in storage_df.select_dtypes(include='object').columns:
+        storage_df[col] = storage_df[col].astype('category')
+    storage_df['year'], storage_df['month'], storage_df['week'] = _calendar_fields(storage_df['period'].to_numpy())
+    
+    if use_cache:
+        os.makedirs(os.path.dirname(CLEAN_CACHE), exist_ok=True)
+        storage_df.to_parquet(CLEAN_CACHE, index=False)
+    
     print(f"   Clean data points: {len(storage_df)}")
     print(f"   Date range: {storage_df['period'].min().strftime('%Y-%m-%d')} to {storage_df['period'].max().strftime('%Y-%m-%d')}")
     print(f"   Value range: {storage_df['value'].min():.2f} to {storage_df['value'].max():.2f} BCF")
@@ -62,15 +136,17 @@ def generate_storage_insights(storage_df):
     """Generate insights from storage data"""
     print("\n🔍 Generating Storage Insights...")
     print("-" * 40)
+    storage_df = _with_calendar(storage_df)
     
-    # Basic statistics
+    # Basic statistics, all from one agg call
+    d = storage_df['value'].agg(['mean', 'median', 'min', 'max', 'std', 'idxmax', 'idxmin'])
     stats = {
         'Total Records': len(storage_df),
-        'Average Storage': f"{storage_df['value'].mean():.2f} BCF",
-        'Median Storage': f"{storage_df['value'].median():.2f} BCF",
-        'Min Storage': f"{storage_df['value'].min():.2f} BCF",
-        'Max Storage': f"{storage_df['value'].max():.2f} BCF",
-        'Standard Deviation': f"{storage_df['value'].std():.2f} BCF",
+        'Average Storage': f"{d['mean']:.2f} BCF",
+        'Median Storage': f"{d['median']:.2f} BCF",
+        'Min Storage': f"{d['min']:.2f} BCF",
+        'Max Storage': f"{d['max']:.2f} BCF",
+        'Standard Deviation': f"{d['std']:.2f} BCF",
         'Date Range': f"{storage_df['period'].min().strftime('%Y-%m-%d')} to {storage_df['period'].max().strftime('%Y-%m-%d')}"
     }
     
@@ -80,9 +156,6 @@ def generate_storage_insights(storage_df):
     
     # Seasonal analysis
     print("\n🌍 Seasonal Analysis:")
-    storage_df['year'] = storage_df['period'].dt.year
-    storage_df['month'] = storage_df['period'].dt.month
-    storage_df['week'] = storage_df['period'].dt.isocalendar().week
     
     # Monthly averages
     monthly_avg = storage_df.groupby('month')['value'].mean()
@@ -93,8 +166,8 @@ def generate_storage_insights(storage_df):
         print(f"      {month_names[month-1]}: {avg:.2f}")
     
     # Find peak and low storage periods
-    peak_storage = storage_df.loc[storage_df['value'].idxmax()]
-    low_storage = storage_df.loc[storage_df['value'].idxmin()]
+    peak_storage = storage_df.loc[d['idxmax']]
+    low_storage = storage_df.loc[d['idxmin']]
     
     print(f"\n📈 Peak Storage: {peak_storage['value']:.2f} BCF on {peak_storage['period'].strftime('%Y-%m-%d')}")
     print(f"📉 Low Storage: {low_storage['value']:.2f} BCF on {low_storage['period'].strftime('%Y-%m-%d')}")
@@ -105,6 +178,7 @@ def create_storage_visualizations(storage_df):
     """Create visualizations for storage data"""
     print("\n🎨 Creating Visualizations...")
     print("-" * 40)
+    storage_df = _with_calendar(storage_df)
     
     # Set up plotting style
     plt.style.use('seaborn-v0_8')
@@ -113,8 +187,21 @@ def create_storage_visualizations(storage_df):
     # Create a comprehensive visualization
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
     
+    # Dates are converted to matplotlib day numbers once and shared by the
+    # time-axis panels, so the per-point date converter never runs
+    xnum = mdates.date2num(storage_df['period'].to_numpy())
+    values = storage_df['value'].to_numpy()
+    
+    def _date_axis(ax):
+        ax.xaxis_date()
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    
     # 1. Time series plot
-    ax1.plot(storage_df['period'], storage_df['value'], linewidth=1, alpha=0.8)
+    keep = _minmax_envelope(values)
+    ax1.plot(xnum[keep], values[keep], linewidth=1, alpha=0.8)
+    _date_axis(ax1)
     ax1.set_title('Natural Gas Storage Over Time', fontsize=16, fontweight='bold')
     ax1.set_ylabel('Storage (BCF)', fontsize=12)
     ax1.grid(True, alpha=0.3)
@@ -133,8 +220,10 @@ def create_storage_visualizations(storage_df):
     ax2.grid(True, alpha=0.3)
     
     # 3. Monthly box plot
-    monthly_data = [storage_df[storage_df['month'] == month]['value'].values 
-                    for month in range(1, 13)]
+    # One groupby pass instead of a boolean scan per month; absent months plot empty
+    by_month = {month: g.to_numpy() for month, g in storage_df.groupby('month')['value']}
+    empty = np.empty(0, dtype=storage_df['value'].dtype)
+    monthly_data = [by_month.get(month, empty) for month in range(1, 13)]
     month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     ax3.boxplot(monthly_data, labels=month_labels)
@@ -144,8 +233,9 @@ def create_storage_visualizations(storage_df):
     ax3.tick_params(axis='x', rotation=45)
     
     # 4. Recent trend (last 2 years)
-    recent_data = storage_df[storage_df['period'] >= (datetime.now() - timedelta(days=730))]
-    ax4.plot(recent_data['period'], recent_data['value'], linewidth=2, alpha=0.8, color='orange')
+    recent = xnum >= mdates.date2num(datetime.now() - timedelta(days=730))
+    ax4.plot(xnum[recent], values[recent], linewidth=2, alpha=0.8, color='orange')
+    _date_axis(ax4)
     ax4.set_title('Recent Storage Trend (Last 2 Years)', fontsize=16, fontweight='bold')
     ax4.set_ylabel('Storage (BCF)', fontsize=12)
     ax4.grid(True, alpha=0.3)
@@ -160,25 +250,29 @@ def export_storage_data(storage_df):
     """Export storage data in various formats"""
     print("\n💾 Exporting Data...")
     print("-" * 40)
+    storage_df = _with_calendar(storage_df)
     
     # Create export directory
     export_dir = "natural_gas_analysis_export"
     if not os.path.exists(export_dir):
         os.makedirs(export_dir)
     
-    # Export full dataset
-    full_filename = os.path.join(export_dir, "natural_gas_storage_full.csv")
-    storage_df.to_csv(full_filename, index=False)
+    # Export full dataset: zstd Parquet keeps the compact dtypes and is far
+    # quicker to write and read back than CSV. The summaries below stay CSV
+    # since they are small and opened in Excel.
+    full_filename = os.path.join(export_dir, "natural_gas_storage_full.parquet")
+    storage_df.to_parquet(full_filename, index=False, engine='pyarrow', compression='zstd')
     print(f"✅ Full dataset exported to: {full_filename}")
     
     # Export summary statistics
-    summary_stats = storage_df.groupby(storage_df['period'].dt.year)['value'].agg(['mean', 'min', 'max', 'std']).round(2)
+    # Grouped on the year/month fields; renamed so the CSV headers stay 'period'
+    summary_stats = storage_df.groupby(storage_df['year'].rename('period'))['value'].agg(['mean', 'min', 'max', 'std']).round(2)
     summary_filename = os.path.join(export_dir, "natural_gas_storage_summary.csv")
     summary_stats.to_csv(summary_filename)
     print(f"✅ Annual summary exported to: {summary_filename}")
     
     # Export monthly averages
-    monthly_avg = storage_df.groupby(storage_df['period'].dt.month)['value'].mean().round(2)
+    monthly_avg = storage_df.groupby(storage_df['month'].rename('period'))['value'].mean().round(2)
     monthly_filename = os.path.join(export_dir, "natural_gas_storage_monthly.csv")
     monthly_avg.to_csv(monthly_filename)
     print(f"✅ Monthly averages exported to: {monthly_filename}")
@@ -187,6 +281,7 @@ def export_storage_data(storage_df):
 
 def main():
     """Main analysis function"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🔋 Natural Gas Storage Comprehensive Analysis")
     print("=" * 60)
     print("This script analyzes natural gas storage data from the EIA API")
@@ -210,7 +305,7 @@ def main():
         
         print("\n🎯 Analysis complete!")
         print("📊 Natural gas storage data has been analyzed, visualized, and exported")
-        print("💡 Check the export directory for CSV files with your data")
+        print("💡 Check the export directory for the Parquet dataset and CSV summaries")
         
     except Exception as e:
         print(f"\n❌ Analysis error: {e}")
@@ -5,6 +5,10 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 
+# Bronze files: zstd with dictionary-encoded string columns, so readers that
+# project a few columns only decode those pages
+PARQUET_OPTS = dict(engine="pyarrow", compression="zstd", row_group_size=8192, use_dictionary=True)
+
 def seed_weekly_storage():
     Path("data/bronze").mkdir(parents=True, exist_ok=True)
     # 9 Fridays -> realistic weekly series across Jul–Aug 2025
@@ -18,7 +22,7 @@ def seed_weekly_storage():
             "area": "US",
         }
     )
-    wk.to_parquet("data/bronze/eia_weekly_storage.parquet", index=False)
+    wk.to_parquet("data/bronze/eia_weekly_storage.parquet", index=False, **PARQUET_OPTS)
     return wk.shape
 
 def seed_capacity():
@@ -31,7 +35,7 @@ def seed_capacity():
             "design_capacity": [4200.0],
         }
     )
-    cap.to_parquet("data/bronze/eia_capacity.parquet", index=False)
+    cap.to_parquet("data/bronze/eia_capacity.parquet", index=False, **PARQUET_OPTS)
     return cap.shape
 
 def seed_ops_gap_window():
@@ -4,10 +4,20 @@ Environment setup script for EIA Storage Accrual Engine
 Helps users configure their environment safely without exposing API keys
 """
 
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Potential API keys: quoted alphanumeric runs of 20+ characters. Compiled once
+# and matched against raw file bytes.
+KEY_PATTERN = re.compile(rb'["\']([a-zA-Z0-9]{20,})["\']')
+KEY_FALSE_POSITIVES = {'your_eia_api_key_here', 'placeholder', 'example'}
+# Directories never scanned; pruned from the walk rather than filtered after
+SKIP_DIRS = {'__pycache__', '.git', 'site-packages', 'node_modules'}
+
 def check_env_file():
     """Check if .env file exists and is properly configured"""
     env_path = Path('.env')
@@ -80,35 +90,45 @@ def check_git_ignore():
         print("❌ .env is not in .gitignore")
         return False
 
+def _iter_py_files(top='.'):
+    for root, dirnames, filenames in os.walk(top):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and 'venv' not in d]
+        for name in filenames:
+            if name.endswith('.py'):
+                yield Path(root, name)
+
+def _scan_one(file_path):
+    """Return (file_path, matches, error) for a single file"""
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return file_path, [], None  # empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return file_path, KEY_PATTERN.findall(mm), None
+    except (OSError, ValueError) as e:
+        return file_path, [], e
+
 def check_for_hardcoded_keys():
     """Check for hardcoded API keys in Python files"""
     print("\n🔍 Scanning for hardcoded API keys...")
     
-    python_files = list(Path('.').rglob('*.py'))
     found_keys = []
     
-    for file_path in python_files:
-        if 'venv' in str(file_path) or '__pycache__' in str(file_path):
+    # Files are independent, so reads overlap across worker threads; map()
+    # keeps walk order for the report
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = list(ex.map(_scan_one, _iter_py_files()))
+    
+    for file_path, matches, error in results:
+        if error is not None:
+            print(f"⚠️  Could not read {file_path}: {error}")
             continue
-            
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Look for potential API keys (high entropy strings)
-            import re
-            # Pattern for potential API keys (alphanumeric, 20+ chars)
-            pattern = r'["\']([a-zA-Z0-9]{20,})["\']'
-            matches = re.findall(pattern, content)
-            
-            for match in matches:
-                # Skip common false positives
-                if match in ['your_eia_api_key_here', 'placeholder', 'example']:
-                    continue
-                found_keys.append((file_path, match))
-                
-        except Exception as e:
-            print(f"⚠️  Could not read {file_path}: {e}")
+        for match in matches:
+            key = match.decode('ascii')
+            # Skip common false positives
+            if key in KEY_FALSE_POSITIVES:
+                continue
+            found_keys.append((file_path, key))
     
     if found_keys:
         print("🚨 FOUND HARDCODED API KEYS:")
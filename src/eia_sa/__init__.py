@@ -1,10 +1,16 @@
 """EIA Storage Accrual Engine package."""
 
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("eia-sa")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+def __getattr__(name: str):
+    # __version__ is looked up on first access: importing importlib.metadata
+    # costs more than the rest of the CLI's startup together
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            v = version("eia-sa")
+        except PackageNotFoundError:
+            v = "0.0.0"
+        globals()["__version__"] = v
+        return v
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ["__version__"]
@@ -1,7 +1,8 @@
 """Accrual package for EIA Storage Accrual Engine."""
 
-from .methods import MethodA, MethodB, MethodC, BlendedEstimator
+from .methods import (MethodA, MethodB, MethodC, BlendedEstimator, WeeklyPanel, prepare_weekly, fill_stratum,
+                      month_end_date)
 from .kpis import compute_kpis
-from .calculator import AccrualInputs, calc_accruals, DEFAULT_BCF_TO_MMBTU
+from .calculator import AccrualInputs, calc_accruals, calc_accruals_batch, DEFAULT_BCF_TO_MMBTU
 
-__all__ = ["MethodA", "MethodB", "MethodC", "BlendedEstimator", "compute_kpis", "AccrualInputs", "calc_accruals", "DEFAULT_BCF_TO_MMBTU"]
+__all__ = ["MethodA", "MethodB", "MethodC", "BlendedEstimator", "WeeklyPanel", "prepare_weekly", "fill_stratum", "month_end_date", "compute_kpis", "AccrualInputs", "calc_accruals", "calc_accruals_batch", "DEFAULT_BCF_TO_MMBTU"]
@@ -1,10 +1,15 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import NamedTuple, Sequence
 
 DEFAULT_BCF_TO_MMBTU = 1_037_000.0
 
-@dataclass
+# Rollforward columns carried through to the accruals frame
+_KEEP_COLS = ("month_end", "region", "stratum", "end_working_gas_bcf")
+
+@dataclass(frozen=True, slots=True)
 class AccrualInputs:
     wacog_per_mmbtu: float
     bcf_to_mmbtu_factor: float = DEFAULT_BCF_TO_MMBTU
@@ -15,24 +20,107 @@ class AccrualInputs:
     penalty_probability: float = 0.0
     penalty_amount: float = 0.0
 
-def _inventory_value(bcf: float, ai: AccrualInputs) -> float:
-    return bcf * ai.bcf_to_mmbtu_factor * ai.wacog_per_mmbtu
+_INPUT_FIELDS = tuple(f.name for f in fields(AccrualInputs))
+
+class _InputArrays(NamedTuple):
+    # AccrualInputs fields as per-row float64 arrays (calc_accruals_batch)
+    wacog_per_mmbtu: np.ndarray
+    bcf_to_mmbtu_factor: np.ndarray
+    tariff_fixed_monthly: np.ndarray
+    tariff_injection_per_mmbtu: np.ndarray
+    tariff_withdrawal_per_mmbtu: np.ndarray
+    scenario_band: np.ndarray
+    penalty_probability: np.ndarray
+    penalty_amount: np.ndarray
+
+def _stack_inputs(inputs: Sequence[AccrualInputs]) -> _InputArrays:
+    # The kernel's ufuncs broadcast the per-row arrays exactly as they do scalars
+    rows = np.array([[getattr(ai, f) for f in _INPUT_FIELDS] for ai in inputs], dtype=np.float64)
+    return _InputArrays(*rows.reshape(-1, len(_INPUT_FIELDS)).T)
+
+def _accrual_kernel(end_bcf: np.ndarray, inj_bcf: np.ndarray, wd_bcf: np.ndarray,
+                    ai: AccrualInputs | _InputArrays) -> np.ndarray:
+    # Fused accrual arithmetic: every step writes in place into one
+    # preallocated (5, N) block, so no temporaries beyond the block itself.
+    # Rows: inventory, variable fees, total low, total base, total high.
+    f = ai.bcf_to_mmbtu_factor
+    out = np.empty((5, end_bcf.size))
+    inv, var, low, base, high = out
+
+    np.multiply(end_bcf, f, out=inv)
+    inv *= ai.wacog_per_mmbtu
+    np.multiply(inj_bcf, f, out=var)
+    var *= ai.tariff_injection_per_mmbtu
+    np.multiply(wd_bcf, f, out=low)  # withdrawal fees, staged in the low row
+    low *= ai.tariff_withdrawal_per_mmbtu
+    var += low
+
+    np.add(inv, var, out=base)
+    base += ai.tariff_fixed_monthly
+    base += ai.penalty_probability * ai.penalty_amount
+    np.multiply(base, 1.0 - ai.scenario_band, out=low)
+    np.multiply(base, 1.0 + ai.scenario_band, out=high)
+    return out
+
+def _accrual_scalars(end_bcf: float, inj_bcf: float, wd_bcf: float,
+                     ai: AccrualInputs) -> tuple[float, float, float, float, float]:
+    # Same arithmetic, in the same order, as _accrual_kernel on plain floats
+    f = ai.bcf_to_mmbtu_factor
+    inv = end_bcf * f * ai.wacog_per_mmbtu
+    var = inj_bcf * f * ai.tariff_injection_per_mmbtu + wd_bcf * f * ai.tariff_withdrawal_per_mmbtu
+    base = inv + var + ai.tariff_fixed_monthly + ai.penalty_probability * ai.penalty_amount
+    return inv, var, base * (1.0 - ai.scenario_band), base, base * (1.0 + ai.scenario_band)
 
 def calc_accruals(monthly_roll: pd.DataFrame, ai: AccrualInputs) -> pd.DataFrame:
-    df = monthly_roll.copy()
-    df["inventory_accrual"] = df["end_working_gas_bcf"].apply(lambda x: _inventory_value(x, ai))
-    inj_mmbtu = df["est_injections_bcf"] * ai.bcf_to_mmbtu_factor
-    wd_mmbtu  = df["est_withdrawals_bcf"] * ai.bcf_to_mmbtu_factor
-    df["variable_fees"] = inj_mmbtu * ai.tariff_injection_per_mmbtu + wd_mmbtu * ai.tariff_withdrawal_per_mmbtu
-    df["fixed_demand"] = ai.tariff_fixed_monthly
-    df["penalties_est"] = ai.penalty_probability * ai.penalty_amount
-    df["total_accrual_base"] = df["inventory_accrual"] + df["variable_fees"] + df["fixed_demand"] + df["penalties_est"]
-    band = ai.scenario_band
-    df["total_accrual_low"]  = df["total_accrual_base"] * (1 - band)
-    df["total_accrual_high"] = df["total_accrual_base"] * (1 + band)
-    cols = [
-        "month_end","region","stratum","end_working_gas_bcf",
-        "inventory_accrual","variable_fees","fixed_demand","penalties_est",
-        "total_accrual_low","total_accrual_base","total_accrual_high"
-    ]
-    return df[cols]
+    if len(monthly_roll) == 1:
+        # Single region/stratum/month (the narrative case): skip the array kernel
+        block = np.array(_accrual_scalars(
+            float(monthly_roll["end_working_gas_bcf"].array[0]),
+            float(monthly_roll["est_injections_bcf"].array[0]),
+            float(monthly_roll["est_withdrawals_bcf"].array[0]),
+            ai,
+        ))[:, None]
+    else:
+        block = _accrual_kernel(
+            monthly_roll["end_working_gas_bcf"].to_numpy(dtype=np.float64, copy=False),
+            monthly_roll["est_injections_bcf"].to_numpy(dtype=np.float64, copy=False),
+            monthly_roll["est_withdrawals_bcf"].to_numpy(dtype=np.float64, copy=False),
+            ai,
+        )
+
+    return _accruals_frame(monthly_roll, block, ai)
+
+def calc_accruals_batch(monthly_rolls: pd.DataFrame, inputs: Sequence[AccrualInputs]) -> pd.DataFrame:
+    """Accruals for many rollforward rows at once, each with its own inputs.
+
+    ``inputs[i]`` applies to row ``i`` of ``monthly_rolls`` (e.g. several
+    months concatenated, one assumption set per month), so a whole horizon is
+    one kernel call and one frame instead of a ``calc_accruals`` call per month.
+    """
+    if len(inputs) != len(monthly_rolls):
+        raise ValueError(f"calc_accruals_batch: {len(inputs)} inputs for {len(monthly_rolls)} rows")
+    ai = _stack_inputs(inputs)
+    block = _accrual_kernel(
+        monthly_rolls["end_working_gas_bcf"].to_numpy(dtype=np.float64, copy=False),
+        monthly_rolls["est_injections_bcf"].to_numpy(dtype=np.float64, copy=False),
+        monthly_rolls["est_withdrawals_bcf"].to_numpy(dtype=np.float64, copy=False),
+        ai,
+    )
+    return _accruals_frame(monthly_rolls, block, ai)
+
+def _accruals_frame(monthly_roll: pd.DataFrame, block: np.ndarray,
+                    ai: AccrualInputs | _InputArrays) -> pd.DataFrame:
+    # block: the (5, N) kernel output, one row per accrual column
+    inventory, variable_fees, low, base, high = block
+    out = {c: monthly_roll[c].array for c in _KEEP_COLS}
+    out.update(
+        inventory_accrual=inventory,
+        variable_fees=variable_fees,
+        fixed_demand=ai.tariff_fixed_monthly,
+        penalties_est=ai.penalty_probability * ai.penalty_amount,
+        total_accrual_low=low,
+        total_accrual_base=base,
+        total_accrual_high=high,
+    )
+    # Built straight from the column arrays: no copy of monthly_roll first
+    return pd.DataFrame(out, index=monthly_roll.index, copy=False)
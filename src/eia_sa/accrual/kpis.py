@@ -2,14 +2,24 @@ from __future__ import annotations
 import pandas as pd
 import numpy as np
 
+_KEYS = ["region", "stratum"]
+
 def compute_kpis(monthly_roll: pd.DataFrame, capacity: pd.DataFrame | None) -> pd.DataFrame:
-    df = monthly_roll.copy()
+    # Built from the roll's column arrays: no copy of monthly_roll first
+    cols = {c: monthly_roll[c].array for c in monthly_roll.columns}
+    index = monthly_roll.index
     if capacity is not None and not capacity.empty:
-        latest_cap = capacity.sort_values("year").groupby(["region","stratum"]).tail(1)
-        df = df.merge(latest_cap[["region","stratum","working_capacity_bcf"]], on=["region","stratum"], how="left")
-        df["pct_of_capacity"] = (df["end_working_gas_bcf"] / df["working_capacity_bcf"]) * 100.0
+        latest_cap = capacity.sort_values("year").groupby(_KEYS).tail(1)
+        # Left join on (region, stratum) as an index lookup into the small
+        # capacity table; unmatched keys get NaN
+        pos = pd.MultiIndex.from_frame(latest_cap[_KEYS]).get_indexer(pd.MultiIndex.from_frame(monthly_roll[_KEYS]))
+        caps = latest_cap["working_capacity_bcf"].to_numpy(dtype=np.float64)
+        working = np.where(pos >= 0, caps[pos], np.nan) if len(caps) else np.full(len(pos), np.nan)
+        cols["working_capacity_bcf"] = working
+        cols["pct_of_capacity"] = (monthly_roll["end_working_gas_bcf"].to_numpy(dtype=np.float64) / working) * 100.0
+        index = pd.RangeIndex(len(monthly_roll))  # as a merge would
     else:
-        df["pct_of_capacity"] = np.nan
+        cols["pct_of_capacity"] = np.nan
     # placeholder for future: z-score vs 5yr avg at month-end
-    df["zscore_vs_5yr"] = np.nan
-    return df
+    cols["zscore_vs_5yr"] = np.nan
+    return pd.DataFrame(cols, index=index, copy=False)
@@ -1,75 +1,204 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import calendar
 import datetime as dt
+import os
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Optional, Protocol, Dict
+from typing import Optional, Protocol, Dict, Tuple
 
 class Estimator(Protocol):
     def estimate_gap(self, weekly: pd.DataFrame, asof: dt.date, region: str = "US", stratum: Optional[str] = None) -> float: ...
 
-def _select_series(weekly: pd.DataFrame, region: str, stratum: Optional[str]) -> pd.DataFrame:
-    w = weekly.copy()
-    w = w[(w["region"] == region) & (w["stratum"].fillna("none") == (stratum or "none"))]
-    return w.sort_values("date_reported")
+def fill_stratum(s: pd.Series) -> pd.Series:
+    """Stratum column with missing values read as ``"none"``.
 
-def _gap_days(last_friday: dt.date, month_end: dt.date) -> int:
-    return max((month_end - last_friday).days, 0)
+    A categorical column gets ``"none"`` added as a category first, kept in
+    sorted order so keys order as they do for plain strings.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype) and "none" not in s.cat.categories:
+        s = s.cat.set_categories(sorted([*s.cat.categories, "none"]))
+    return s.fillna("none")
+
+def _series_arrays(weekly: pd.DataFrame, region: str, stratum: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+    # One key's report dates (datetime64[ns], ascending, NaT last) and weekly
+    # deltas in the same order; the per-key estimators work on these alone
+    w = weekly[(weekly["region"] == region) & (fill_stratum(weekly["stratum"]) == (stratum or "none"))]
+    d = pd.to_datetime(w["date_reported"]).to_numpy(dtype="datetime64[ns]")
+    order = np.argsort(d, kind="stable")
+    return d[order], w["delta_week_bcf"].to_numpy(dtype=np.float64)[order]
+
+def _n_upto(dates: np.ndarray, asof: dt.date) -> int:
+    # Count of sorted report dates on or before asof
+    return int(np.searchsorted(dates, np.datetime64(asof, "ns"), side="right"))
+
+def _month_end_np(asof: dt.date) -> np.datetime64:
+    return (np.datetime64(asof, "M") + np.timedelta64(1, "M")).astype("datetime64[D]") - np.timedelta64(1, "D")
+
+def _gap_days(last_friday: np.datetime64, month_end: np.datetime64) -> int:
+    # Whole calendar days from the last report to month end, never negative
+    return max(int((month_end - last_friday.astype("datetime64[D]")) // np.timedelta64(1, "D")), 0)
+
+def month_end_date(d: dt.date) -> dt.date:
+    """Last calendar day of ``d``'s month (plain calendar arithmetic)."""
+    return d.replace(day=calendar.monthrange(d.year, d.month)[1])
+
+_KEYS = ["region", "stratum"]
+
+@dataclass(frozen=True)
+class WeeklyPanel:
+    """Weekly rows prepared once for the batch estimators; see :func:`prepare_weekly`.
+
+    Stratum filled, keys categorical (factorized once, so each groupby works
+    on integer codes instead of hashing strings), sorted by key then report
+    date, plus per-key gap inputs for one as-of date.
+    """
+    w: pd.DataFrame
+    d: pd.Series  # date_reported as datetime64
+    asof: dt.date
+    month_end: dt.date
+    upto: pd.Series  # rows reported on or before asof
+    idx: pd.MultiIndex  # every (region, stratum) in the frame, categorical levels
+    last_fri: pd.Series  # per key; NaT where nothing is reported by asof
+    gap_days: pd.Series  # per key, int64
+
+def prepare_weekly(weekly: pd.DataFrame, asof: dt.date) -> WeeklyPanel:
+    """Prepare weekly silver rows for the ``estimate_gap_batch`` methods.
+
+    Build it once per (frame, as-of date) and pass it to every estimator.
+    """
+    # Fill before casting: "none" need not be an existing category
+    w = weekly.assign(region=weekly["region"].astype("category"),
+                      stratum=fill_stratum(weekly["stratum"]).astype("category"))
+    w = w.sort_values([*_KEYS, "date_reported"], kind="stable")
+    # numpy datetime64[ns] whatever the input: dt.date objects, Arrow dates or
+    # Arrow/numpy timestamps
+    d = pd.to_datetime(w["date_reported"]).astype("datetime64[ns]")
+    me = month_end_date(asof)
+    idx = pd.MultiIndex.from_frame(w[_KEYS].drop_duplicates())
+    upto = d <= pd.Timestamp(asof)
+    last_fri = d[upto].groupby([w["region"][upto], w["stratum"][upto]], observed=True).max().reindex(idx)
+    gap_days = (pd.Timestamp(me) - last_fri).dt.days.clip(lower=0).fillna(0).astype("int64")
+    return WeeklyPanel(w, d, asof, me, upto, idx, last_fri, gap_days)
+
+_OPS_COLUMNS = ["date", "region", "stratum", "inj_bcf", "wd_bcf"]
+
+@lru_cache(maxsize=8)
+def _load_ops(path: str, mtime_ns: int) -> pd.DataFrame:
+    # Parsed once per file version: a rewrite changes mtime_ns and misses the cache.
+    # Ops files may be Parquet (only the used columns are read) or the CSV hand-off.
+    if str(path).endswith(".parquet"):
+        ops = pd.read_parquet(path, columns=_OPS_COLUMNS)
+        ops["date"] = pd.to_datetime(ops["date"])
+    else:
+        ops = pd.read_csv(path, usecols=_OPS_COLUMNS, parse_dates=["date"])
+    ops["date"] = ops["date"].dt.normalize()
+    ops["stratum"] = ops["stratum"].fillna("none")
+    # Missing volumes count as zero; filled once here rather than per estimate
+    ops[["inj_bcf", "wd_bcf"]] = ops[["inj_bcf", "wd_bcf"]].astype(np.float64).fillna(0.0)
+    return ops
+
+def _read_ops(path: str) -> Optional[pd.DataFrame]:
+    # Shared cached frame (filter, don't mutate), or None if there is no ops file
+    try:
+        return _load_ops(path, os.stat(path).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+# Numeric cores: plain float64 arrays in, float out. The estimator classes
+# below only select rows and work out the gap length.
+def _trailing_rate_gap(deltas: np.ndarray, gap_days: int) -> float:
+    # Average daily change over the trailing weekly deltas, projected over the gap
+    if deltas.size == 0: return 0.0
+    return float(np.nansum(deltas) / (7 * deltas.size) * gap_days)
+
+def _seasonal_rate_gap(deltas: np.ndarray, gap_days: int) -> float:
+    # Mean daily change over same-month weekly deltas, projected over the gap
+    if deltas.size == 0: return 0.0
+    return float(np.nanmean(deltas) / 7.0 * gap_days)
 
 @dataclass(frozen=True)
 class MethodA:
     lookback_weeks: int = 4
     def estimate_gap(self, weekly: pd.DataFrame, asof: dt.date, region: str = "US", stratum: Optional[str] = None) -> float:
-        sr = _select_series(weekly, region, stratum)
-        sr = sr[sr["date_reported"] <= asof]
-        if sr.empty: return 0.0
-        last_friday = pd.to_datetime(sr["date_reported"].max()).date()
-        month_end = (pd.Timestamp(asof).to_period("M").end_time.date())
-        g = _gap_days(last_friday, month_end)
-        tail = sr.tail(self.lookback_weeks)
-        if tail.empty: return 0.0
-        avg_daily = tail["delta_week_bcf"].sum() / (7 * len(tail))
-        return float(avg_daily * g)
+        return self._gap(*_series_arrays(weekly, region, stratum), asof)
+    def _gap(self, dates: np.ndarray, deltas: np.ndarray, asof: dt.date) -> float:
+        n = _n_upto(dates, asof)
+        if n == 0: return 0.0
+        g = _gap_days(dates[n - 1], _month_end_np(asof))
+        return _trailing_rate_gap(deltas[max(n - self.lookback_weeks, 0):n], g)
+    def estimate_gap_batch(self, p: WeeklyPanel) -> pd.Series:
+        # Every key at once: trailing lookback_weeks deltas per key
+        w, upto = p.w, p.upto
+        tail = w["delta_week_bcf"][upto].groupby([w["region"][upto], w["stratum"][upto]], observed=True).tail(self.lookback_weeks)
+        tail_g = tail.groupby([w["region"][tail.index], w["stratum"][tail.index]], observed=True)
+        return (tail_g.sum() / (7 * tail_g.size())).reindex(p.idx, fill_value=0.0) * p.gap_days
 
 @dataclass(frozen=True)
 class MethodB:
     def estimate_gap(self, weekly: pd.DataFrame, asof: dt.date, region: str = "US", stratum: Optional[str] = None) -> float:
-        sr = _select_series(weekly, region, stratum)
-        sr = sr[sr["date_reported"] <= asof].copy()
-        if sr.empty: return 0.0
-        sr["month"] = pd.to_datetime(sr["date_reported"]).dt.month
-        sr["daily_rate"] = sr["delta_week_bcf"] / 7.0
-        month_avg = sr.groupby("month", as_index=True)["daily_rate"].mean()
-        last_friday = pd.to_datetime(sr["date_reported"].max()).date()
-        month_end = (pd.Timestamp(asof).to_period("M").end_time.date())
-        g = _gap_days(last_friday, month_end)
-        return float(month_avg.loc[asof.month] * g) if asof.month in month_avg.index else 0.0
+        return self._gap(*_series_arrays(weekly, region, stratum), asof)
+    def _gap(self, dates: np.ndarray, deltas: np.ndarray, asof: dt.date) -> float:
+        n = _n_upto(dates, asof)
+        if n == 0: return 0.0
+        same_month = dates[:n].astype("datetime64[M]").astype(np.int64) % 12 + 1 == asof.month
+        g = _gap_days(dates[n - 1], _month_end_np(asof))
+        return _seasonal_rate_gap(deltas[:n][same_month], g)
+    def estimate_gap_batch(self, p: WeeklyPanel) -> pd.Series:
+        # Every key at once: mean of same-calendar-month deltas per key
+        w = p.w
+        same_month = p.upto & (p.d.dt.month == p.asof.month)
+        rate = w["delta_week_bcf"][same_month].groupby([w["region"][same_month], w["stratum"][same_month]], observed=True).mean() / 7.0
+        return rate.reindex(p.idx, fill_value=0.0) * p.gap_days
 
 @dataclass(frozen=True)
 class MethodC:
     ops_path: str = "data/ops/ops_volumes.csv"
     def estimate_gap(self, weekly: pd.DataFrame, asof: dt.date, region: str = "US", stratum: Optional[str] = None) -> float:
-        sr = _select_series(weekly, region, stratum)
-        if sr.empty: return 0.0
-        last_friday = pd.to_datetime(sr[sr["date_reported"] <= asof]["date_reported"].max()).date()
-        month_end = (pd.Timestamp(asof).to_period("M").end_time.date())
+        dates, _ = _series_arrays(weekly, region, stratum)
+        return self._gap(dates, asof, region, stratum)
+    def _gap(self, dates: np.ndarray, asof: dt.date, region: str, stratum: Optional[str]) -> float:
+        n = _n_upto(dates, asof)
+        if n == 0: return 0.0
+        last_friday = dates[n - 1].astype("datetime64[D]")
+        month_end = _month_end_np(asof)
         if month_end <= last_friday: return 0.0
-        try:
-            ops = pd.read_csv(self.ops_path, parse_dates=["date"])
-        except FileNotFoundError:
-            return 0.0
-        ops = ops[(ops["date"].dt.date > last_friday) & (ops["date"].dt.date <= month_end)]
-        ops = ops[(ops["region"] == region) & (ops["stratum"].fillna("none") == (stratum or "none"))]
-        if ops.empty: return 0.0
-        net = float(ops["inj_bcf"].fillna(0).sum() - ops["wd_bcf"].fillna(0).sum())
-        return net
+        ops = _read_ops(self.ops_path)
+        if ops is None: return 0.0
+        # One boolean mask over the raw column arrays; no intermediate frames
+        od = ops["date"].to_numpy()
+        mask = ((od > last_friday) & (od <= month_end)
+                & (ops["region"].to_numpy() == region) & (ops["stratum"].to_numpy() == (stratum or "none")))
+        if not mask.any(): return 0.0
+        return float(ops["inj_bcf"].to_numpy()[mask].sum() - ops["wd_bcf"].to_numpy()[mask].sum())
+    def estimate_gap_batch(self, p: WeeklyPanel) -> pd.Series:
+        # Every key at once: net ops volumes in (last Friday, month end]
+        ops = _read_ops(self.ops_path)
+        last_fri = p.last_fri.dropna()
+        if ops is None:
+            return pd.Series(0.0, index=p.idx)
+        # Ops keys take the panel's categories; keys the panel lacks become NaN
+        # and drop out of the inner join
+        ops = ops[ops["date"] <= pd.Timestamp(p.month_end)].astype({k: p.w[k].dtype for k in _KEYS})
+        ops = ops.join(last_fri.rename("last_fri"), on=_KEYS, how="inner")
+        ops = ops[ops["date"] > ops["last_fri"]]
+        net = ops["inj_bcf"] - ops["wd_bcf"]
+        return net.groupby([ops["region"], ops["stratum"]], observed=True).sum().reindex(p.idx, fill_value=0.0)
 
 @dataclass
 class BlendedEstimator:
     weights: Dict[str, float]
     mA: MethodA; mB: MethodB; mC: MethodC
     def estimate_gap(self, weekly: pd.DataFrame, asof: dt.date, region: str = "US", stratum: Optional[str] = None) -> float:
-        a = self.mA.estimate_gap(weekly, asof, region, stratum)
-        b = self.mB.estimate_gap(weekly, asof, region, stratum)
-        c = self.mC.estimate_gap(weekly, asof, region, stratum)
-        wA = self.weights.get("A", 0.3); wB = self.weights.get("B", 0.2); wC = self.weights.get("C", 0.5)
-        return float(wA*a + wB*b + wC*c)
+        # Select and sort the key's rows once for all three methods
+        dates, deltas = _series_arrays(weekly, region, stratum)
+        a = self.mA._gap(dates, deltas, asof)
+        b = self.mB._gap(dates, deltas, asof)
+        c = self.mC._gap(dates, asof, region, stratum)
+        w = np.array([self.weights.get("A", 0.3), self.weights.get("B", 0.2), self.weights.get("C", 0.5)])
+        return float(np.dot(w, (a, b, c)))
+    def estimate_gap_batch(self, p: WeeklyPanel) -> pd.Series:
+        # Blended gap for every key in one pass per method, not one call per key
+        wa, wb, wc = self.weights.get("A", 0.3), self.weights.get("B", 0.2), self.weights.get("C", 0.5)
+        return wa * self.mA.estimate_gap_batch(p) + wb * self.mB.estimate_gap_batch(p) + wc * self.mC.estimate_gap_batch(p)
@@ -4,16 +4,8 @@ import datetime as dt
 import pandas as pd
 from typing import Optional
 
-def _comma(n: float | int | None) -> str:
-    if n is None:
-        return "—"
-    return f"{n:,.0f}"
-
-def _comma2(n: float | int | None) -> str:
-    if n is None:
-        return "—"
-    return f"{n:,.2f}"
-
+# Only pct_capacity can be missing; every other figure is formatted inline
+# with a format spec in the section f-strings
 def _pct(n: float | None) -> str:
     if n is None:
         return "—"
@@ -52,16 +44,16 @@ def cfo_summary(n: NarrativeInputs) -> str:
     wA, wB, wC = n.weights
     pct_cap = _pct(n.pct_capacity)
     lines = [
-        f"As of {n.month_end.isoformat()}, estimated working gas is **{_comma(n.end_bcf)} Bcf**, "
+        f"As of {n.month_end.isoformat()}, estimated working gas is **{n.end_bcf:,.0f} Bcf**, "
         f"which is **{pct_cap} of working capacity**.",
         f"We used the **Base** scenario with blended estimator weights **C:A:B = {wC}:{wA}:{wB}**, "
         f"projecting **{n.gap_days}** gap day(s) from the last EIA Friday report.",
         "",
-        f"**Accrual summary (USD):** Inventory **${_comma(n.inv_accrual)}**, "
-        f"Variable fees **${_comma(n.var_fees)}**, Fixed demand **${_comma(n.fixed_demand)}**, "
-        f"Penalties (expected) **${_comma(n.penalties)}**.",
-        f"Total Base accrual **${_comma(n.total_base)}**, with sensitivity band ±{_pct(n.band_pct*100)} "
-        f"(**${_comma(n.total_low)} – ${_comma(n.total_high)}**).",
+        f"**Accrual summary (USD):** Inventory **${n.inv_accrual:,.0f}**, "
+        f"Variable fees **${n.var_fees:,.0f}**, Fixed demand **${n.fixed_demand:,.0f}**, "
+        f"Penalties (expected) **${n.penalties:,.0f}**.",
+        f"Total Base accrual **${n.total_base:,.0f}**, with sensitivity band ±{n.band_pct*100:.1f}% "
+        f"(**${n.total_low:,.0f} – ${n.total_high:,.0f}**).",
         "",
         f"Context: storage stands **{n.zscore_txt}** relative to the 5-year average; "
         f"risk this month is primarily driven by **{n.hotspot_driver}**. "
@@ -71,13 +63,13 @@ def cfo_summary(n: NarrativeInputs) -> str:
 
 def ops_summary(n: NarrativeInputs) -> str:
     lines = [
-        f"For {n.month_end.isoformat()}, projected **injections = {_comma2(n.inj_bcf)} Bcf** and "
-        f"**withdrawals = {_comma2(n.wd_bcf)} Bcf** (net gap delta {_comma2(n.gap_delta_bcf)} Bcf).",
+        f"For {n.month_end.isoformat()}, projected **injections = {n.inj_bcf:,.2f} Bcf** and "
+        f"**withdrawals = {n.wd_bcf:,.2f} Bcf** (net gap delta {n.gap_delta_bcf:,.2f} Bcf).",
         f"The blended estimator emphasized **{n.dominant_method}** due to {n.rationale}.",
         "",
         "Hotspots:",
         f"- Region: **{n.hotspot_region}** ({n.hotspot_stratum}).",
-        f"  Driver: {n.hotspot_driver}; recommend adjusting nominations by **{_comma2(n.nom_adjust_bcf)} Bcf** "
+        f"  Driver: {n.hotspot_driver}; recommend adjusting nominations by **{n.nom_adjust_bcf:,.2f} Bcf** "
         f"under **{n.scenario_name}** scenario.",
         "",
         "Operational asks:",
@@ -1,86 +1,365 @@
 from __future__ import annotations
 import argparse, sys, datetime as dt
-import pandas as pd
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+# pandas/pyarrow/xlsxwriter and the pipeline modules are imported inside the
+# cmd_* functions that use them, and the package version only when --version
+# asks for it, so --help/--version and parse errors start without paying for
+# them.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+_MKDIR_CACHE: set[Path] = set()
+
+def _ensure_dir(p: Path) -> None:
+    # One mkdir per distinct directory per process
+    p = p.resolve()
+    if p in _MKDIR_CACHE:
+        return
+    p.mkdir(parents=True, exist_ok=True)
+    _MKDIR_CACHE.add(p)
+
+# Output locations per subcommand: (argument dest, is the path a directory)
+OUTPUT_ARGS = {
+    "build-silver": [("weekly_silver_out", False), ("capacity_silver_out", False)],
+    "build-gold": [("monthly_roll_out", False), ("kpis_out", False)],
+    "calc-accruals": [("out_excel", False)],
+    "narratives": [("out_dir", True)],
+}
+
+# Columns each step consumes; reads are projected onto these. calc-accruals
+# reads its inputs whole because write_close_pack copies every column.
+WEEKLY_SILVER_COLS = ["date_reported", "region", "stratum", "working_gas_bcf", "delta_week_bcf"]
+CAPACITY_SILVER_COLS = ["region", "stratum", "year", "working_capacity_bcf"]
+NARRATIVE_ROLL_COLS = ["month_end", "end_working_gas_bcf", "est_injections_bcf",
+                       "est_withdrawals_bcf", "gap_delta_bcf", "gap_days"]
+NARRATIVE_KPI_COLS = ["pct_of_capacity"]
+NARRATIVE_ACCRUAL_COLS = ["inventory_accrual", "variable_fees", "fixed_demand", "penalties_est",
+                          "total_accrual_low", "total_accrual_base", "total_accrual_high"]
+
+def _write_parquet(df: pd.DataFrame, path: str) -> pa.Table:
+    from eia_sa.utils.parquet_io import write_parquet
+    return write_parquet(df, path)
+
+def _pandas_dtype(t):
+    # types_mapper for reads: Arrow-backed columns, except dictionary-encoded
+    # ones (the silver region/stratum keys), which become pandas categoricals
+    # so key filters and groupbys compare integer codes
+    import pandas as pd
+    import pyarrow as pa
+    return None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+
+def _read_parquet(path: str, columns: list[str] | None = None, head: int | None = None) -> pd.DataFrame:
+    import pyarrow.parquet as pq
+    # Project onto the wanted columns that exist (readers tolerate optional
+    # ones being absent); pre_buffer coalesces reads on high-latency storage.
+    if columns is not None:
+        names = set(pq.read_schema(path).names)
+        columns = [c for c in columns if c in names]
+    t = pq.read_table(path, columns=columns, use_threads=True, pre_buffer=True)
+    if head is not None:
+        t = t.slice(0, head)
+    # The table is private to this call: keep the columns Arrow-backed
+    # (ArrowDtype) and release Arrow buffers as they are converted.
+    return t.to_pandas(split_blocks=True, self_destruct=True, types_mapper=_pandas_dtype)
+
+def _parse_weights(text: str) -> tuple[float, ...]:
+    # argparse type= for --weights, so "A,B,C" is parsed and checked once at
+    # the command line
+    try:
+        w = tuple(float(x) for x in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"--weights must be three comma-separated numbers (A,B,C), got {text!r}") from None
+    if len(w) != 3:
+        raise argparse.ArgumentTypeError(f"--weights must be three comma-separated numbers (A,B,C), got {text!r}")
+    if abs(sum(w) - 1.0) > 1e-6:
+        raise argparse.ArgumentTypeError(f"--weights must sum to 1.0, got {sum(w):g}")
+    return w
 
 def cmd_build_silver(args: argparse.Namespace) -> int:
+    if args.verbose > 0:
+        print(f"Building silver from {args.weekly_bronze}")
+    from eia_sa.transform.normalize_weekly import normalize_weekly
+    from eia_sa.transform.normalize_capacity import normalize_capacity
+    w = normalize_weekly(args.weekly_bronze)
+    _ensure_dir(Path(args.weekly_silver_out).parent)
+    _write_parquet(w, args.weekly_silver_out)
+    try:
+        c = normalize_capacity(args.capacity_bronze)
+        _ensure_dir(Path(args.capacity_silver_out).parent)
+        _write_parquet(c, args.capacity_silver_out)
+    except Exception:
+        pass
     print("silver built")
     return 0
 
 def cmd_build_gold(args: argparse.Namespace) -> int:
+    if args.verbose > 0:
+        print(f"Building gold for {args.asof} with weights {args.weights}")
+    from eia_sa.transform.build_gold import build_monthly_rollforward
+    from eia_sa.accrual.kpis import compute_kpis
+    asof_date = dt.date.fromisoformat(args.asof)
+    w = _read_parquet(args.weekly_silver, WEEKLY_SILVER_COLS)
+    from eia_sa.accrual.methods import fill_stratum
+    w["stratum"] = fill_stratum(w["stratum"])
+    mf = build_monthly_rollforward(
+        w, asof=asof_date, weights=args.weights,
+        region=args.region, stratum=None if args.stratum=="none" else args.stratum
+    )
+    _ensure_dir(Path(args.monthly_roll_out).parent)
+    _write_parquet(mf, args.monthly_roll_out)
+    try:
+        cap = _read_parquet(args.capacity_silver, CAPACITY_SILVER_COLS)
+    except Exception:
+        cap = None  # type: ignore
+    k = compute_kpis(mf, cap)  # type: ignore
+    _ensure_dir(Path(args.kpis_out).parent)
+    _write_parquet(k, args.kpis_out)
     print("gold built")
     return 0
 
 def cmd_calc_accruals(args: argparse.Namespace) -> int:
-    print("accruals calculated")
+    if args.verbose > 0:
+        print(f"Calculating accruals for {args.asof} with WACOG {args.wacog}")
+    from concurrent.futures import ThreadPoolExecutor
+    import pyarrow.compute as pc
+    from eia_sa.accrual.calculator import AccrualInputs, calc_accruals, DEFAULT_BCF_TO_MMBTU
+    from eia_sa.utils.excel_pack import write_close_pack
+    roll = _read_parquet(args.monthly_roll)
+    kpis = _read_parquet(args.kpis_path)
+    ai = AccrualInputs(
+        wacog_per_mmbtu=args.wacog,
+        bcf_to_mmbtu_factor=args.bcf_to_mmbtu or DEFAULT_BCF_TO_MMBTU,
+        tariff_fixed_monthly=args.tariff_fixed,
+        tariff_injection_per_mmbtu=args.tariff_inj,
+        tariff_withdrawal_per_mmbtu=args.tariff_wd,
+        scenario_band=args.scenario_band,
+        penalty_probability=args.penalty_probability,
+        penalty_amount=args.penalty_amount,
+    )
+    accruals = calc_accruals(roll, ai)
+    assumptions = {
+        "wacog_per_mmbtu": args.wacog,
+        "bcf_to_mmbtu_factor": ai.bcf_to_mmbtu_factor,
+        "tariff_fixed": args.tariff_fixed,
+        "tariff_injection": args.tariff_inj,
+        "tariff_withdrawal": args.tariff_wd,
+        "scenario_band": args.scenario_band,
+        "penalty_probability": args.penalty_probability,
+        "penalty_amount": args.penalty_amount,
+    }
+    _ensure_dir(Path("data/gold"))
+    _ensure_dir(Path(args.out_excel).parent)
+    # The Excel pack and the Parquet write only read the frames, so run them
+    # side by side; .result() re-raises either failure here.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fut_xlsx = ex.submit(write_close_pack, roll, kpis, accruals, assumptions, args.out_excel)
+        fut_pq = ex.submit(_write_parquet, accruals, "data/gold/accruals.parquet")
+        accruals_tbl = fut_pq.result()
+        fut_xlsx.result()
+
+    # JSON mode for machine consumers; the total comes off the Arrow table
+    # already built for the Parquet write.
+    if args.json:
+        summary = {
+            "asof": args.asof,
+            "rows": accruals_tbl.num_rows,
+            "out_excel": args.out_excel,
+            "total_accrual_base": pc.sum(accruals_tbl.column("total_accrual_base"), min_count=0).as_py(),
+        }
+        try:
+            import orjson
+            print(orjson.dumps(summary).decode())
+        except ImportError:
+            import json
+            print(json.dumps(summary))
+
+    print(f"close pack written: {args.out_excel}")
     return 0
 
 def cmd_narratives(args: argparse.Namespace) -> int:
-    print("narratives generated")
+    if args.verbose > 0:
+        print(f"Generating narratives with weights {args.weights}")
+    from eia_sa.analysis.narratives import build_narrative_inputs, cfo_summary, ops_summary
+    # Narratives describe the first row only
+    roll = _read_parquet(args.monthly_roll, NARRATIVE_ROLL_COLS, head=1)
+    kpis = _read_parquet(args.kpis_path, NARRATIVE_KPI_COLS, head=1)
+    accr = _read_parquet(args.accruals_path, NARRATIVE_ACCRUAL_COLS, head=1)
+    ni = build_narrative_inputs(
+        roll=roll, kpis=kpis, accruals=accr, weights=args.weights, band_pct=args.scenario_band,
+        zscore_txt=args.zscore_txt, dominant_method=args.dominant_method, rationale=args.rationale,
+        hotspot_region=args.hotspot_region, hotspot_stratum=args.hotspot_stratum, hotspot_driver=args.hotspot_driver,
+        nom_adjust_bcf=args.nom_adjust_bcf, scenario_name=args.scenario_name,
+        tariff_inj=args.tariff_inj, tariff_wd=args.tariff_wd
+    )
+    cfo = cfo_summary(ni)
+    ops = ops_summary(ni)
+    out_dir = Path(args.out_dir)
+    _ensure_dir(out_dir)
+    # date32 cell -> datetime.date without a row build or to_datetime inference
+    me = roll["month_end"].array[0]
+    if isinstance(me, dt.datetime):
+        me = me.date()
+    (out_dir / f"narrative_cfo_{me}.md").write_text(cfo, encoding="utf-8")
+    (out_dir / f"narrative_ops_{me}.md").write_text(ops, encoding="utf-8")
+    print(f"wrote narratives to {out_dir}")
     return 0
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="eia-sa")
+class _VersionAction(argparse.Action):
+    # argparse's "version" action, with the version looked up only when used
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from eia_sa import __version__
+        parser._print_message(f"{parser.prog} {__version__}\n", sys.stdout)
+        parser.exit()
+
+class _FastParser(argparse.ArgumentParser):
+    """ArgumentParser that validates ``add_argument`` calls with one cached formatter.
+
+    add_argument builds a HelpFormatter per call only to check that the
+    metavar formats, and each one queries the terminal size. Help and usage
+    rendering still get a fresh formatter, since formatting accumulates state.
+    """
+    _validating = False
+    _validation_fmt: argparse.HelpFormatter | None = None
+
+    def add_argument(self, *args, **kwargs):
+        self._validating = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating = False
+
+    def _get_formatter(self) -> argparse.HelpFormatter:
+        if not self._validating:
+            return super()._get_formatter()
+        if self._validation_fmt is None:
+            self._validation_fmt = super()._get_formatter()
+        return self._validation_fmt
+
+def _add_build_silver_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("-w","--weekly-bronze", default="data/bronze/eia_weekly_storage.parquet")
+    p.add_argument("-c","--capacity-bronze", default="data/bronze/eia_capacity.parquet")
+    p.add_argument("--weekly-silver-out", default="data/silver/eia_weekly_storage.parquet")
+    p.add_argument("--capacity-silver-out", default="data/silver/eia_capacity.parquet")
+    p.set_defaults(func=cmd_build_silver)
+
+def _add_build_gold_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("-A","--asof", required=True, help="Month-end date (YYYY-MM-DD)")
+    p.add_argument("-W","--weights", type=_parse_weights, default="0.3,0.2,0.5", help="Method weights: A,B,C")
+    p.add_argument("-w","--weekly-silver", default="data/silver/eia_weekly_storage.parquet")
+    p.add_argument("-c","--capacity-silver", default="data/silver/eia_capacity.parquet")
+    p.add_argument("-o","--monthly-roll-out", default="data/gold/monthly_storage_rollforward.parquet")
+    p.add_argument("-k","--kpis-out", default="data/gold/monthly_kpis.parquet")
+    p.add_argument("-r","--region", default="US")
+    p.add_argument("-s","--stratum", default="none")
+    p.set_defaults(func=cmd_build_gold)
+
+def _add_calc_accruals_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("-A","--asof", required=True, help="Month-end date (YYYY-MM-DD)")
+    p.add_argument("-W","--wacog", type=float, required=True, help="Weighted average cost of gas ($/MMBtu)")
+    p.add_argument("-b","--bcf-to-mmbtu", type=float, default=None, help="BCF to MMBtu conversion factor")
+    p.add_argument("-f","--tariff-fixed", type=float, default=0.0, help="Fixed monthly tariff ($)")
+    p.add_argument("-i","--tariff-inj", type=float, default=0.0, help="Injection tariff ($/MMBtu)")
+    p.add_argument("-d","--tariff-wd", type=float, default=0.0, help="Withdrawal tariff ($/MMBtu)")
+    p.add_argument("-B","--scenario-band", type=float, default=0.10, help="Scenario band (0.10 = ±10%)")
+    p.add_argument("-p","--penalty-probability", type=float, default=0.0, help="Penalty probability")
+    p.add_argument("-a","--penalty-amount", type=float, default=0.0, help="Penalty amount ($)")
+    p.add_argument("-m","--monthly-roll", default="data/gold/monthly_storage_rollforward.parquet")
+    p.add_argument("-k","--kpis-path", default="data/gold/monthly_kpis.parquet")
+    p.add_argument("-o","--out-excel", default="outputs/monthly_close_pack.xlsx")
+    p.add_argument("-j","--json", action="store_true", help="Emit JSON summary to stdout")
+    p.set_defaults(func=cmd_calc_accruals)
+
+def _add_narratives_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("-W","--weights", type=_parse_weights, default="0.3,0.2,0.5", help="Method weights: A,B,C")
+    p.add_argument("-B","--scenario-band", type=float, default=0.10, help="Scenario band")
+    p.add_argument("-z","--zscore-txt", default="near the 5-year average", help="Z-score description")
+    p.add_argument("-d","--dominant-method", default="Method C (Ops)", help="Dominant estimation method")
+    p.add_argument("-r","--rationale", default="recent nominations/injections during the gap window", help="Estimation rationale")
+    p.add_argument("-R","--hotspot-region", default="US", help="Hotspot region")
+    p.add_argument("-S","--hotspot-stratum", default="none", help="Hotspot stratum")
+    p.add_argument("-D","--hotspot-driver", default="South-Central salt variability", help="Hotspot driver")
+    p.add_argument("-n","--nom-adjust-bcf", type=float, default=0.10, help="Nomination adjustment (BCF)")
+    p.add_argument("-s","--scenario-name", default="cold-snap", help="Scenario name")
+    p.add_argument("-i","--tariff-inj", type=float, default=0.02, help="Injection tariff ($/MMBtu)")
+    p.add_argument("-w","--tariff-wd", type=float, default=0.03, help="Withdrawal tariff ($/MMBtu)")
+    p.add_argument("-m","--monthly-roll", default="data/gold/monthly_storage_rollforward.parquet")
+    p.add_argument("-k","--kpis-path", default="data/gold/monthly_kpis.parquet")
+    p.add_argument("-a","--accruals-path", default="data/gold/accruals.parquet")
+    p.add_argument("-o","--out-dir", default="outputs")
+    p.set_defaults(func=cmd_narratives)
+
+# name -> (help, argument builder). Builders only run for the subcommands
+# being built; the rest are registered with their help text alone.
+SUBCOMMANDS = {
+    "build-silver": ("Normalize bronze parquet to silver", _add_build_silver_args),
+    "build-gold": ("Build monthly rollforward using Methods A/B/C blend", _add_build_gold_args),
+    "calc-accruals": ("Calculate accruals and generate Excel close pack", _add_calc_accruals_args),
+    "narratives": ("Generate CFO and Ops narratives", _add_narratives_args),
+}
+
+def build_parser(commands: Iterable[str] | None = None) -> argparse.ArgumentParser:
+    """Build the ``eia-sa`` parser.
+
+    Only the subcommands in ``commands`` get their arguments registered; the
+    default (``None``) builds all of them. Parsers are cached per command
+    set, so treat the returned parser as read-only.
+    """
+    return _build_parser(None if commands is None else frozenset(commands))
+
+@lru_cache(maxsize=16)
+def _build_parser(commands: frozenset[str] | None) -> argparse.ArgumentParser:
+    # Subparsers inherit the parser class
+    p = _FastParser(
+        prog="eia-sa",
+        description="EIA storage accrual engine (silver→gold→accruals→narratives)",
+        epilog="""Examples:
+  eia-sa build-silver -w data/bronze/eia_weekly_storage.parquet -c data/bronze/eia_capacity.parquet
+  eia-sa build-gold --asof 2025-08-31 --weights 0.3,0.2,0.5
+  eia-sa calc-accruals --asof 2025-08-31 --wacog 3.25 --tariff-fixed 120000
+  eia-sa narratives --out-dir outputs
+        """
+    )
+    p.add_argument("-V","--version", action=_VersionAction)
+    p.add_argument("-v","--verbose", action="count", default=0, help="Increase verbosity (-v, -vv)")
     sub = p.add_subparsers(dest="cmd", required=True)
-    
-    s = sub.add_parser("build-silver")
-    s.add_argument("--weekly-bronze", default="data/bronze/eia_weekly_storage.parquet")
-    s.add_argument("--capacity-bronze", default="data/bronze/eia_capacity.parquet")
-    s.add_argument("--weekly-silver-out", default="data/silver/eia_weekly_storage.parquet")
-    s.add_argument("--capacity-silver-out", default="data/silver/eia_capacity.parquet")
-    s.set_defaults(func=cmd_build_silver)
-
-    g = sub.add_parser("build-gold")
-    g.add_argument("--asof", required=True)
-    g.add_argument("--weights", default="0.3,0.2,0.5")
-    g.add_argument("--weekly-silver", default="data/silver/eia_weekly_storage.parquet")
-    g.add_argument("--capacity-silver", default="data/silver/eia_capacity.parquet")
-    g.add_argument("--monthly-roll-out", default="data/gold/monthly_storage_rollforward.parquet")
-    g.add_argument("--kpis-out", default="data/gold/monthly_kpis.parquet")
-    g.add_argument("--region", default="US")
-    g.add_argument("--stratum", default="none")
-    g.set_defaults(func=cmd_build_gold)
-
-    a = sub.add_parser("calc-accruals")
-    a.add_argument("--asof", required=True)
-    a.add_argument("--wacog", type=float, required=True)
-    a.add_argument("--bcf-to-mmbtu", type=float, default=None)
-    a.add_argument("--tariff-fixed", type=float, default=0.0)
-    a.add_argument("--tariff-inj", type=float, default=0.0)
-    a.add_argument("--tariff-wd", type=float, default=0.0)
-    a.add_argument("--scenario-band", type=float, default=0.10)
-    a.add_argument("--penalty-probability", type=float, default=0.0)
-    a.add_argument("--penalty-amount", type=float, default=0.0)
-    a.add_argument("--monthly-roll", default="data/gold/monthly_storage_rollforward.parquet")
-    a.add_argument("--kpis-path", default="data/gold/monthly_kpis.parquet")
-    a.add_argument("--out-excel", default="outputs/monthly_close_pack.xlsx")
-    a.set_defaults(func=cmd_calc_accruals)
-
-    n = sub.add_parser("narratives")
-    n.add_argument("--weights", default="0.3,0.2,0.5")
-    n.add_argument("--scenario-band", type=float, default=0.10)
-    n.add_argument("--zscore-txt", default="near the 5-year average")
-    n.add_argument("--dominant-method", default="Method C (Ops)")
-    n.add_argument("--rationale", default="recent nominations/injections during the gap window")
-    n.add_argument("--hotspot-region", default="US")
-    n.add_argument("--hotspot-stratum", default="none")
-    n.add_argument("--hotspot-driver", default="South-Central salt variability")
-    n.add_argument("--nom-adjust-bcf", type=float, default=0.10)
-    n.add_argument("--scenario-name", default="cold-snap")
-    n.add_argument("--tariff-inj", type=float, default=0.02)
-    n.add_argument("--tariff-wd", type=float, default=0.03)
-    n.add_argument("--monthly-roll", default="data/gold/monthly_storage_rollforward.parquet")
-    n.add_argument("--kpis-path", default="data/gold/monthly_kpis.parquet")
-    n.add_argument("--accruals-path", default="data/gold/accruals.parquet")
-    n.add_argument("--out-dir", default="outputs")
-    n.set_defaults(func=cmd_narratives)
-    
+    for name, (help_text, add_args) in SUBCOMMANDS.items():
+        sp = sub.add_parser(name, help=help_text)
+        if commands is None or name in commands:
+            add_args(sp)
     return p
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else argv
+    # Only the invoked subcommand needs its arguments (the first non-option
+    # token; top-level options take no values); help, --version and usage
+    # errors are served from the name/help stubs.
+    command = next((a for a in argv if not a.startswith("-")), None)
+    parser = build_parser((command,) if command in SUBCOMMANDS else ())
     args = parser.parse_args(argv)
-    return args.func(args)
+    try:
+        # Create every output directory up front; the step's own
+        # _ensure_dir calls are then set lookups.
+        for dest, is_dir in OUTPUT_ARGS.get(args.cmd, ()):
+            out = Path(getattr(args, dest))
+            _ensure_dir(out if is_dir else out.parent)
+        rc = args.func(args)
+        return int(rc) if isinstance(rc, int) else 0
+    except KeyboardInterrupt:
+        print("Interrupted.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        if getattr(args, "verbose", 0) > 0:
+            raise
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
@@ -1,15 +1,70 @@
 """Configuration management for EIA Storage Accrual Engine."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+
+def _parse_weights(value: str) -> tuple[float, float, float]:
+    parts = [float(x) for x in value.split(",")]
+    if len(parts) != 3:
+        raise ValueError("estimator weights must have exactly 3 values (A,B,C)")
+    if abs(sum(parts) - 1.0) > 1e-6:
+        raise ValueError(f"estimator weights must sum to 1.0, got {sum(parts):g}")
+    return parts[0], parts[1], parts[2]
+
+
 class Settings(BaseSettings):
     eia_api_key: str | None = None     # optional
-    # optionally: log_level: str | None = "INFO"
+
+    # Data processing defaults (see env.example)
+    default_start_date: str = "2010-01-01"
+    default_end_date: str = "2025-12-31"
+    default_scenario_band: float = 0.10
+    bcf_to_mmbtu_factor: float = 1_037_000.0
+    default_tariff_fixed_monthly: float = 120_000.0
+    default_tariff_injection: float = 0.02
+    default_tariff_withdrawal: float = 0.03
+    default_wacog_per_mmbtu: float = 3.25
+    default_estimator_weights: str = "0.3,0.2,0.5"  # Methods A,B,C
+
+    # Logging; log_level stays None so EIA_SA_LOG_LEVEL applies unless set
+    log_level: str | None = None
+    log_format: str = "json"
+
+    # Data storage paths
+    data_bronze_path: str = "./data/bronze"
+    data_silver_path: str = "./data/silver"
+    data_gold_path: str = "./data/gold"
+    outputs_path: str = "./outputs"
+    logs_path: str = "./logs"
+
+    # EIA API
+    eia_base_url: str = "https://api.eia.gov/v2"
+    eia_request_timeout: int = 30
+    eia_max_retries: int = 3
+    eia_backoff_factor: float = 2
+
     model_config = SettingsConfigDict(
         env_file=".env", env_prefix="", extra="ignore"
     )
 
+    @field_validator("default_estimator_weights")
+    @classmethod
+    def _check_weights(cls, v: str) -> str:
+        _parse_weights(v)
+        return v
+
+    # Parsed once per instance; status/dashboard read these repeatedly
+    @cached_property
+    def estimator_weights_tuple(self) -> tuple[float, float, float]:
+        return _parse_weights(self.default_estimator_weights)
+
+    @cached_property
+    def estimator_weights_dict(self) -> dict[str, float]:
+        a, b, c = self.estimator_weights_tuple
+        return {"method_a": a, "method_b": b, "method_c": c}
+
 @lru_cache
 def get_settings() -> Settings:
     # lazy, validated on first use only
@@ -19,6 +74,8 @@ def get_settings() -> Settings:
 def __getattr__(name: str):
     # allows:  from eia_sa.config import settings
     if name == "settings":
-        return get_settings()
+        # Bind on first access so later lookups are plain module attributes
+        s = globals()["settings"] = get_settings()
+        return s
     raise AttributeError(name)
 # ----------------------------------------
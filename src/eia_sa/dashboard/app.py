@@ -1,9 +1,14 @@
 from __future__ import annotations
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 import pandas as pd
 import streamlit as st
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # --- Resolve repo root from this file: .../src/eia_sa/dashboard/app.py  -> repo = parents[3] ---
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
@@ -44,19 +49,74 @@ def _ensure_dirs():
     for p in ["data/bronze","data/silver","data/gold","data/ops","outputs"]:
         _p(p).mkdir(parents=True, exist_ok=True)
 
-@st.cache_data(show_spinner=False)
-def _read_parquet(p: str) -> pd.DataFrame:
+def _mtime(pth: Path) -> int | None:
+    # Nanosecond stamp, so two writes within one float-mtime tick still differ
+    try:
+        return pth.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+# Columns each step consumes; reads are projected onto these
+CAPACITY_COLS = ("region", "stratum", "year", "working_capacity_bcf")
+NARRATIVE_KPI_COLS = ("pct_of_capacity",)
+NARRATIVE_ACCRUAL_COLS = ("inventory_accrual", "variable_fees", "fixed_demand", "penalties_est",
+                          "total_accrual_low", "total_accrual_base", "total_accrual_high")
+
+# The mtime is part of the cache key, so rewriting a file on disk invalidates its entry.
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_parquet(path: str, mtime: int | None, columns: tuple[str, ...] | None = None,
+                  head: int | None = None, arrow: bool = False) -> pd.DataFrame | pa.Table:
+    import pyarrow as pa
+    if mtime is None:
+        return pa.table({}) if arrow else pd.DataFrame()
+    import pyarrow.dataset as ds
+    dataset = ds.dataset(path, format="parquet")
+    # Only columns that exist; readers tolerate optional ones being absent
+    wanted = None if columns is None else [c for c in columns if c in dataset.schema.names]
+    if head is not None:
+        # Stops scanning once the first rows are in; later row groups are not read
+        table = dataset.head(head, columns=wanted)
+    else:
+        table = dataset.to_table(columns=wanted)
+    return table if arrow else table.to_pandas()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_num_rows(path: str, mtime: int | None) -> int:
+    # Row count from the Parquet footers alone
+    if mtime is None:
+        return 0
+    import pyarrow.dataset as ds
+    return ds.dataset(path, format="parquet").count_rows()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_csv(path: str, mtime: int | None) -> pd.DataFrame:
+    return pd.read_csv(path, parse_dates=["date"]) if mtime is not None else pd.DataFrame()
+
+def _read_parquet(p: str, columns: tuple[str, ...] | None = None, head: int | None = None) -> pd.DataFrame:
     pth = _p(p)
-    return pd.read_parquet(pth) if pth.exists() else pd.DataFrame()
+    return _load_parquet(str(pth), _mtime(pth), columns, head)
+
+def _read_preview(p: str, n: int) -> pa.Table:
+    # First n rows as Arrow; st.dataframe takes the table as-is, with no
+    # pandas round trip on each rerun
+    pth = _p(p)
+    return _load_parquet(str(pth), _mtime(pth), None, n, arrow=True)
+
+def _shape(p: str, df: pd.DataFrame | pa.Table) -> tuple[int, int]:
+    # Full-file shape for a frame read with head=: rows from the footers
+    pth = _p(p)
+    return (_load_num_rows(str(pth), _mtime(pth)), df.shape[1])
 
-@st.cache_data(show_spinner=False)
 def _read_csv(p: str) -> pd.DataFrame:
     pth = _p(p)
-    return pd.read_csv(pth, parse_dates=["date"]) if pth.exists() else pd.DataFrame()
+    return _load_csv(str(pth), _mtime(pth))
 
 def _write_parquet(df: pd.DataFrame, p: str) -> None:
+    # Shared writer (zstd-3, dictionary pages, statistics) with 100k-row
+    # groups so the column/head reads above can skip row groups.
+    from eia_sa.utils.parquet_io import write_parquet
     _p(p).parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(_p(p), index=False)
+    write_parquet(df, _p(p), row_group_size=100_000)
 
 def main():
     _ensure_dirs()
@@ -77,6 +137,10 @@ def main():
 
     st.sidebar.divider()
     show_previews = st.sidebar.checkbox("Show data previews", value=True)
+    # Reads are keyed on file mtime and pick up rewrites on their own; this
+    # only forces a reload (e.g. after a copy that preserved mtimes)
+    if st.sidebar.button("🔄 Refresh Previews"):
+        st.cache_data.clear()
 
     # Optional "Run All" chain
     run_all = st.sidebar.button("🚀 Run All (Silver → Gold → Accruals → Narratives)")
@@ -111,17 +175,14 @@ def main():
 
         if show_previews:
             st.caption("Silver Weekly Preview")
-            # Add manual refresh button to bypass cache
-            if st.button("🔄 Refresh Preview", key="refresh_silver"):
-                st.cache_data.clear()
-            silver_data = _read_parquet(DATA["silver_weekly"])
-            st.write(f"Silver data shape: {silver_data.shape}")
+            silver_data = _read_preview(DATA["silver_weekly"], 20)
+            st.write(f"Silver data shape: {_shape(DATA['silver_weekly'], silver_data)}")
             st.write(f"Silver data path: {_p(DATA['silver_weekly'])}")
-            if not silver_data.empty:
-                st.dataframe(silver_data.head(20), use_container_width=True)
+            if silver_data.num_rows:
+                st.dataframe(silver_data, use_container_width=True)
             else:
                 st.warning("No silver data found for preview. File may not exist or be empty.")
-                st.info("Try clicking '🔄 Refresh Preview' to clear cache and reload data.")
+                st.info("Try '🔄 Refresh Previews' in the sidebar to clear the cache and reload data.")
 
     # -------- 2) Gold --------
     with tab2:
@@ -145,7 +206,7 @@ def main():
                 _write_parquet(mf, DATA["gold_roll"])
                 # capacity optional
                 try:
-                    cap = _read_parquet(DATA["silver_capacity"])
+                    cap = _read_parquet(DATA["silver_capacity"], CAPACITY_COLS)
                     k = compute_kpis(mf, cap)
                 except Exception:
                     k = compute_kpis(mf, None)  # type: ignore
@@ -156,18 +217,15 @@ def main():
 
         if show_previews:
             st.caption("Monthly Rollforward Preview")
-            # Add manual refresh button to bypass cache
-            if st.button("🔄 Refresh Preview", key="refresh_gold"):
-                st.cache_data.clear()
-            preview_data = _read_parquet(DATA["gold_roll"])
-            st.write(f"Preview - Gold data shape: {preview_data.shape}")
+            preview_data = _read_preview(DATA["gold_roll"], 50)
+            st.write(f"Preview - Gold data shape: {_shape(DATA['gold_roll'], preview_data)}")
             st.write(f"Preview - Gold data path: {_p(DATA['gold_roll'])}")
-            st.write(f"Preview - Gold data columns: {list(preview_data.columns)}")
-            if not preview_data.empty:
-                st.dataframe(preview_data.head(50), use_container_width=True)
+            st.write(f"Preview - Gold data columns: {preview_data.column_names}")
+            if preview_data.num_rows:
+                st.dataframe(preview_data, use_container_width=True)
             else:
                 st.warning("No gold data found for preview. File may not exist or be empty.")
-                st.info("Try clicking '🔄 Refresh Preview' to clear cache and reload data.")
+                st.info("Try '🔄 Refresh Previews' in the sidebar to clear the cache and reload data.")
 
     # -------- 3) Accruals + Excel --------
     with tab3:
@@ -218,18 +276,15 @@ def main():
 
         if show_previews:
             st.caption("Accruals Preview")
-            # Add manual refresh button to bypass cache
-            if st.button("🔄 Refresh Preview", key="refresh_accruals"):
-                st.cache_data.clear()
-            accruals_data = _read_parquet(DATA["gold_accruals"])
-            st.write(f"Preview - Accruals data shape: {accruals_data.shape}")
+            accruals_data = _read_preview(DATA["gold_accruals"], 50)
+            st.write(f"Preview - Accruals data shape: {_shape(DATA['gold_accruals'], accruals_data)}")
             st.write(f"Preview - Accruals data path: {_p(DATA['gold_accruals'])}")
-            st.write(f"Preview - Accruals data columns: {list(accruals_data.columns)}")
-            if not accruals_data.empty:
-                st.dataframe(accruals_data.head(50), use_container_width=True)
+            st.write(f"Preview - Accruals data columns: {accruals_data.column_names}")
+            if accruals_data.num_rows:
+                st.dataframe(accruals_data, use_container_width=True)
             else:
                 st.warning("No accruals data found for preview. File may not exist or be empty.")
-                st.info("Try clicking '🔄 Refresh Preview' to clear cache and reload data.")
+                st.info("Try '🔄 Refresh Previews' in the sidebar to clear the cache and reload data.")
 
     # -------- 4) Narratives --------
     with tab4:
@@ -247,12 +302,16 @@ def main():
         do_narr = st.button("Build Narratives") or run_all
         if do_narr:
             try:
-                roll = _read_parquet(DATA["gold_roll"])
-                kpis = _read_parquet(DATA["gold_kpis"])
-                accr = _read_parquet(DATA["gold_accruals"])
+                # Narratives describe the first row; the debug lines show three
+                # (pyarrow releases the GIL while reading, so the three overlap)
+                with ThreadPoolExecutor(max_workers=3) as ex:
+                    f_roll = ex.submit(_read_parquet, DATA["gold_roll"], head=3)
+                    f_kpis = ex.submit(_read_parquet, DATA["gold_kpis"], NARRATIVE_KPI_COLS, head=1)
+                    f_accr = ex.submit(_read_parquet, DATA["gold_accruals"], NARRATIVE_ACCRUAL_COLS, head=1)
+                    roll, kpis, accr = f_roll.result(), f_kpis.result(), f_accr.result()
                 
                 # Debug info for narratives
-                st.write(f"Narratives step - Roll data shape: {roll.shape}")
+                st.write(f"Narratives step - Roll data shape: {_shape(DATA['gold_roll'], roll)}")
                 st.write(f"Narratives step - Roll data path: {_p(DATA['gold_roll'])}")
                 st.write(f"Narratives step - Roll data columns: {list(roll.columns)}")
                 st.write(f"Narratives step - Roll data head: {roll.head(3).to_dict()}")
@@ -299,7 +358,7 @@ def main():
             except Exception as e:
                 st.error(f"Narratives failed: {e}")
                 st.error(f"Error type: {type(e).__name__}")
-                import traceback
+                import traceback  # only needed on this error path
                 st.code(traceback.format_exc())
 
 if __name__ == "__main__":
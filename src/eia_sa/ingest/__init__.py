@@ -1,5 +1,5 @@
 """Data ingestion modules for EIA Storage Accrual Engine."""
 
-from .eia_client import EIAClient
+from .eia_client import EIAClient, default_client
 
-__all__ = ["EIAClient"]
+__all__ = ["EIAClient", "default_client"]
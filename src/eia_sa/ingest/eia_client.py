@@ -1,33 +1,74 @@
 """EIA API client for data ingestion with retry logic and structured logging."""
 
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # optional: faster JSONL serialization of raw responses
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from eia_sa.config import settings
 from eia_sa.utils.logging import get_logger, log_api_request
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent API requests per client (EIA rate limits)
+MAX_CONCURRENCY = 8
+
+# Rows per request; EIA API v2 caps a single response at 5000
+PAGE_LENGTH = 5000
+
+
+def _records_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a DataFrame from API records via Arrow.
+
+    ``Table.from_pylist`` infers typed columns in C++ instead of pandas
+    walking every dict as Python objects; columns stay Arrow-backed.
+    """
+    return pa.Table.from_pylist(records).to_pandas(types_mapper=pd.ArrowDtype)
+
 
 class EIAClient:
-    """EIA API client with retry logic, backoff, and structured logging."""
+    """EIA API client with retry logic, backoff, and structured logging.
+
+    The client keeps one pooled ``requests.Session`` for its lifetime so
+    repeated calls reuse keep-alive connections. Use it as a context manager
+    (``with EIAClient() as client:``) to close the pool when done.
+    """
 
     def __init__(self, api_key: Optional[str] = None) -> None:
         """Initialize EIA client with API key and retry configuration."""
         self.api_key = api_key or settings.eia_api_key
         self.base_url = settings.eia_base_url
+        self.timeout = settings.eia_request_timeout
         self.session = self._create_session()
         
         # Ensure bronze directory exists
         Path(settings.data_bronze_path).mkdir(parents=True, exist_ok=True)
 
+    def __enter__(self) -> "EIAClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic and backoff."""
         session = requests.Session()
@@ -40,12 +81,14 @@ class EIAClient:
             allowed_methods=["GET", "POST"],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per concurrent page fetch, so parallel
+        # requests never find the pool full and open throwaway connections
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=MAX_CONCURRENCY)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
-        # Set default timeout
-        session.timeout = settings.eia_request_timeout
+        # Sent with every request on this session
+        session.params = {"api_key": self.api_key}
         
         return session
 
@@ -57,26 +100,23 @@ class EIAClient:
         """Make API request with logging and error handling."""
         url = f"{self.base_url}/{endpoint}"
         
-        # Add API key to params
-        request_params = params or {}
-        request_params["api_key"] = self.api_key
-        
         start_time = time.time()
         
         try:
-            logger.info("Making EIA API request", **log_api_request(
+            logger.info("Making EIA API request: %s", endpoint, extra=log_api_request(
                 endpoint=endpoint,
                 status_code=0,
                 response_time=0,
                 url=url,
-                params=request_params
+                params=params
             ))
             
-            response = self.session.get(url, params=request_params)
+            # The API key rides on the session params (see _create_session)
+            response = self.session.get(url, params=params, timeout=self.timeout)
             response_time = time.time() - start_time
             
             # Log the response
-            logger.info("EIA API response received", **log_api_request(
+            logger.info("EIA API response received: %s", endpoint, extra=log_api_request(
                 endpoint=endpoint,
                 status_code=response.status_code,
                 response_time=response_time,
@@ -89,7 +129,7 @@ class EIAClient:
             
         except requests.exceptions.RequestException as e:
             response_time = time.time() - start_time
-            logger.error("EIA API request failed", **log_api_request(
+            logger.error("EIA API request failed: %s", endpoint, extra=log_api_request(
                 endpoint=endpoint,
                 status_code=getattr(e.response, 'status_code', 0) if hasattr(e, 'response') else 0,
                 response_time=response_time,
@@ -98,58 +138,111 @@ class EIAClient:
             ))
             raise
 
+    def _fetch_weekly_query(
+        self, regions: List[str], start_date: str, end_date: str, max_workers: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch weekly storage records for ``regions`` in one query; raises on failure.
+
+        All regions go in one query (repeated ``facets[duoarea][]``). If the
+        result runs past one page, the remaining offsets are fetched
+        concurrently over the shared session.
+        """
+        endpoint = 'natural-gas/stor/wkly/data'
+        params = {
+            'frequency': 'weekly',
+            'data[0]': 'value',
+            'facets[duoarea][]': list(regions),
+            'start': start_date,
+            'end': end_date,
+            # Region, then newest first: the order the per-region calls gave
+            'sort[0][column]': 'duoarea',
+            'sort[0][direction]': 'asc',
+            'sort[1][column]': 'period',
+            'sort[1][direction]': 'desc',
+            'offset': 0,
+            'length': PAGE_LENGTH
+        }
+        
+        data = self._make_request(endpoint, params)
+        if 'response' not in data or 'data' not in data['response']:
+            logger.warning("Invalid response structure for weekly storage data")
+            return []
+        records = list(data['response']['data'])
+        total = int(data['response'].get('total') or len(records))
+        offsets = range(PAGE_LENGTH, total, PAGE_LENGTH) if len(records) >= PAGE_LENGTH else ()
+        if offsets:
+            workers = max(1, min(max_workers, MAX_CONCURRENCY, len(offsets)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = executor.map(
+                    lambda offset: self._make_request(endpoint, {**params, 'offset': offset}),
+                    offsets,
+                )
+                for page in pages:
+                    records.extend(page['response']['data'])
+        return records
+
+    def _fetch_weekly_pages(
+        self, regions: List[str], start_date: str, end_date: str, max_workers: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch weekly storage records for all regions; failures yield [].
+
+        Tries the combined query first. If any of its pages fails, each
+        region is fetched on its own, so one bad facet only loses that
+        region's records rather than the whole sweep.
+        """
+        try:
+            return self._fetch_weekly_query(regions, start_date, end_date, max_workers)
+        except Exception as e:
+            if len(regions) <= 1:
+                logger.error(f"Failed to fetch weekly storage data for regions {regions}: {e}")
+                return []
+            logger.warning(f"Combined weekly storage request for regions {regions} failed ({e}); "
+                           "retrying per region")
+        
+        workers = max(1, min(max_workers, MAX_CONCURRENCY, len(regions)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_region = executor.map(
+                lambda region: self._fetch_weekly_pages([region], start_date, end_date, 1),
+                regions,
+            )
+            return [record for records in per_region for record in records]
+
     def fetch_weekly_storage(
         self, 
         start_date: str, 
         end_date: str,
-        regions: Optional[List[str]] = None
+        regions: Optional[List[str]] = None,
+        max_workers: int = MAX_CONCURRENCY,
     ) -> pd.DataFrame:
-        """Fetch weekly working gas storage data."""
-        logger.info("Fetching weekly storage data", 
-                   start_date=start_date, end_date=end_date, regions=regions)
+        """Fetch weekly working gas storage data.
+
+        Every region is requested in a single multi-facet call rather than one
+        call per region; if that call fails, the regions are retried one by
+        one. ``max_workers`` bounds the concurrent page (or per-region
+        fallback) requests, capped at ``MAX_CONCURRENCY`` to stay within EIA
+        rate limits.
+        """
+        logger.info("Fetching weekly storage data: %s to %s, regions=%s",
+                    start_date, end_date, regions)
         
         # Default regions if none specified
         if regions is None:
             regions = ["R10", "R20", "R30", "R40", "R50"]  # US regions
         
-        all_data = []
-        
-        for region in regions:
-            params = {
-                'frequency': 'weekly',
-                'data[0]': 'value',
-                'facets[duoarea][]': region,
-                'start': start_date,
-                'end': end_date,
-                'sort[0][column]': 'period',
-                'sort[0][direction]': 'desc',
-                'offset': 0,
-                'length': 5000
-            }
-            
-            try:
-                data = self._make_request('natural-gas/stor/wkly/data', params)
-                
-                if 'response' in data and 'data' in data['response']:
-                    region_data = data['response']['data']
-                    if region_data:
-                        all_data.extend(region_data)
-                        logger.info(f"Retrieved {len(region_data)} records for region {region}")
-                    else:
-                        logger.warning(f"No data found for region {region}")
-                else:
-                    logger.warning(f"Invalid response structure for region {region}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to fetch data for region {region}", error=str(e))
-                continue
+        all_data = self._fetch_weekly_pages(regions, start_date, end_date, max_workers)
         
         if not all_data:
             logger.warning("No weekly storage data retrieved")
             return pd.DataFrame()
         
         # Convert to DataFrame
-        df = pd.DataFrame(all_data)
+        df = _records_frame(all_data)
+        counts = df.groupby('duoarea').size() if 'duoarea' in df else pd.Series(dtype=int)
+        for region in regions:
+            if counts.get(region, 0):
+                logger.info(f"Retrieved {counts[region]} records for region {region}")
+            else:
+                logger.warning(f"No data found for region {region}")
         logger.info(f"Total weekly storage records: {len(df)}")
         
         return df
@@ -159,7 +252,7 @@ class EIAClient:
         if year is None:
             year = datetime.now().year
             
-        logger.info("Fetching capacity data", year=year)
+        logger.info(f"Fetching capacity data for {year}")
         
         params = {
             'frequency': 'annual',
@@ -177,7 +270,7 @@ class EIAClient:
             if 'response' in data and 'data' in data['response']:
                 capacity_data = data['response']['data']
                 if capacity_data:
-                    df = pd.DataFrame(capacity_data)
+                    df = _records_frame(capacity_data)
                     logger.info(f"Retrieved {len(df)} capacity records for {year}")
                     return df
                 else:
@@ -188,34 +281,54 @@ class EIAClient:
                 return pd.DataFrame()
                 
         except Exception as e:
-            logger.error("Failed to fetch capacity data", error=str(e))
+            logger.error(f"Failed to fetch capacity data: {e}")
             return pd.DataFrame()
 
     def save_raw_data(self, data: Dict[str, Any], filename: str) -> None:
         """Save raw API response to JSONL file."""
         filepath = Path(settings.data_bronze_path) / f"{filename}.jsonl"
         
+        items = data.get('response', {}).get('data', [])
+        dumps = orjson.dumps if orjson is not None else (lambda item: json.dumps(item).encode())
+        
         try:
-            with open(filepath, 'w') as f:
-                for item in data.get('response', {}).get('data', []):
-                    f.write(f"{item}\n")
+            # One JSON document per line, joined and written in a single call
+            with open(filepath, 'wb') as f:
+                if items:
+                    f.write(b"\n".join(map(dumps, items)) + b"\n")
             
             logger.info(f"Raw data saved to {filepath}")
             
         except Exception as e:
-            logger.error(f"Failed to save raw data to {filepath}", error=str(e))
+            logger.error(f"Failed to save raw data to {filepath}: {e}")
+            raise
+
+    def save_raw_records(self, df: pd.DataFrame, filename: str) -> None:
+        """Save a DataFrame of API records to a JSONL file.
+
+        Serializes straight from the columns rather than building one Python
+        dict per row first.
+        """
+        filepath = Path(settings.data_bronze_path) / f"{filename}.jsonl"
+        
+        try:
+            df.to_json(filepath, orient="records", lines=True, date_format="iso")
+            logger.info(f"Raw records saved to {filepath}")
+            
+        except Exception as e:
+            logger.error(f"Failed to save raw records to {filepath}: {e}")
             raise
 
     def save_parquet_data(self, df: pd.DataFrame, filename: str) -> None:
-        """Save normalized data to parquet file."""
+        """Save normalized data to a single Parquet file ``<bronze>/<filename>.parquet``."""
         filepath = Path(settings.data_bronze_path) / f"{filename}.parquet"
         
         try:
-            df.to_parquet(filepath, index=False)
+            df.to_parquet(filepath, index=False, compression="zstd")
             logger.info(f"Parquet data saved to {filepath}")
             
         except Exception as e:
-            logger.error(f"Failed to save parquet data to {filepath}", error=str(e))
+            logger.error(f"Failed to save parquet data to {filepath}: {e}")
             raise
 
     def get_data_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
@@ -229,28 +342,50 @@ class EIAClient:
             "regions": df.get('duoarea', pd.Series()).unique().tolist() if 'duoarea' in df.columns else [],
         }
         
+        # Columns are converted into temporary Arrow arrays; the caller's
+        # frame is left as is
         if 'period' in df.columns:
             try:
-                df['period'] = pd.to_datetime(df['period'])
+                # Repeated periods (one per region) are parsed once via cache=;
+                # unparseable ones become NaT -> null and are skipped
+                period = pa.array(pd.to_datetime(df['period'], errors='coerce', cache=True), from_pandas=True)
+                mm = pc.min_max(period).as_py()
                 summary["date_range"] = {
-                    "start": df['period'].min().strftime('%Y-%m-%d'),
-                    "end": df['period'].max().strftime('%Y-%m-%d')
-                }
+                    "start": mm["min"].strftime('%Y-%m-%d'),
+                    "end": mm["max"].strftime('%Y-%m-%d')
+                } if mm["min"] is not None else None
             except Exception as e:
                 logger.warning(f"Could not parse date range: {e}")
                 summary["date_range"] = None
         
         if 'value' in df.columns:
             try:
-                df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                summary["value_stats"] = {
-                    "min": float(df['value'].min()),
-                    "max": float(df['value'].max()),
-                    "mean": float(df['value'].mean()),
-                    "median": float(df['value'].median())
+                # Unparseable values become NaN -> null, which Arrow's
+                # kernels skip as pandas skips NaN; min and max come from one scan
+                value = pa.array(pd.to_numeric(df['value'], errors='coerce'), type=pa.float64(), from_pandas=True)
+                mm = pc.min_max(value).as_py()
+                stats = {
+                    "min": mm["min"],
+                    "max": mm["max"],
+                    "mean": pc.mean(value).as_py(),
+                    "median": pc.quantile(value, q=0.5)[0].as_py(),  # exact, interpolated like pandas
                 }
+                # An all-null column gives None; report NaN as pandas did
+                summary["value_stats"] = {k: float('nan') if v is None else v for k, v in stats.items()}
             except Exception as e:
                 logger.warning(f"Could not calculate value statistics: {e}")
                 summary["value_stats"] = None
         
         return summary
+
+
+@lru_cache(maxsize=1)
+def default_client() -> EIAClient:
+    """Process-wide client shared by every caller.
+
+    Its session, and the keep-alive/TLS connections pooled in it, live for
+    the process, so repeated fetches from a long-running process (dashboard,
+    notebook) skip the handshakes. Do not close it; use ``EIAClient()`` as a
+    context manager for a private client with its own lifetime.
+    """
+    return EIAClient()
@@ -2,6 +2,8 @@
 
 from .normalize_weekly import normalize_weekly
 from .normalize_capacity import normalize_capacity
-from .build_gold import build_monthly_rollforward
+from .build_gold import (build_estimator, build_monthly_history, build_monthly_rollforward, build_monthly_rollforward_all,
+                         build_rollforward_index)
 
-__all__ = ["normalize_weekly", "normalize_capacity", "build_monthly_rollforward"]
+__all__ = ["normalize_weekly", "normalize_capacity", "build_monthly_rollforward", "build_monthly_rollforward_all",
+           "build_rollforward_index", "build_monthly_history", "build_estimator"]
@@ -1,60 +1,199 @@
 from __future__ import annotations
 import datetime as dt
+import numpy as np
 import pandas as pd
-from eia_sa.accrual.methods import MethodA, MethodB, MethodC, BlendedEstimator
+from eia_sa.accrual.methods import (BlendedEstimator, MethodA, MethodB, MethodC, fill_stratum, month_end_date,
+                                    prepare_weekly)
 
-def _month_end(d: dt.date) -> dt.date:
-    return (pd.Timestamp(d).to_period("M").end_time.date())  # type: ignore
+# Output schema, in column order
+_ROLL_DTYPES = {
+    "month_end": object,
+    "region": object,
+    "stratum": object,
+    "beg_working_gas_bcf": np.float64,
+    "est_injections_bcf": np.float64,
+    "est_withdrawals_bcf": np.float64,
+    "gap_delta_bcf": np.float64,
+    "gap_days": np.int64,
+    "end_working_gas_bcf": np.float64,
+}
+_EMPTY = pd.DataFrame({c: np.empty(0, dtype=t) for c, t in _ROLL_DTYPES.items()})
 
-def _last_reported_friday(sr: pd.DataFrame, asof: dt.date) -> dt.date:
-    return pd.to_datetime(sr[sr["date_reported"] <= asof]["date_reported"].max()).date()
+def _run_bounds(codes: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    # Start and end positions of each run of rows with equal codes
+    n = codes[0].size
+    brk = np.zeros(max(n - 1, 0), dtype=bool)
+    for c in codes:
+        brk |= c[1:] != c[:-1]
+    ends = np.flatnonzero(np.r_[brk, n > 0])
+    starts = np.r_[0, ends[:-1] + 1] if ends.size else ends
+    return starts, ends
 
-def build_monthly_rollforward(
+def build_estimator(
+    weights: tuple[float, float, float] = (0.3, 0.2, 0.5),
+    lookback_weeks: int = 4,
+    ops_path: str = MethodC.ops_path,
+) -> BlendedEstimator:
+    """The Method A/B/C blend a rollforward uses; build once and reuse in loops."""
+    return BlendedEstimator(dict(zip("ABC", weights, strict=True)), MethodA(lookback_weeks), MethodB(), MethodC(ops_path))
+
+def build_monthly_rollforward_all(
     weekly_silver: pd.DataFrame,
     asof: dt.date,
-    weights=(0.3, 0.2, 0.5),
-    region="US",
-    stratum=None,
+    weights: tuple[float, float, float] = (0.3, 0.2, 0.5),
+    lookback_weeks: int = 4,
+    ops_path: str = MethodC.ops_path,
+    estimator: BlendedEstimator | None = None,
 ) -> pd.DataFrame:
-    sr = weekly_silver[
-        (weekly_silver["region"] == region)
-        & (weekly_silver["stratum"].fillna("none") == (stratum or "none"))
-    ].copy()
-    sr = sr.sort_values("date_reported")
-    me = _month_end(asof)
-    prev_me = _month_end((pd.Timestamp(me) - pd.offsets.MonthBegin(1)).date())  # type: ignore
-
-    # beginning = last month-end working_gas
-    beg = float(sr[sr["date_reported"] <= prev_me]["working_gas_bcf"].tail(1).squeeze()) if not sr.empty else 0.0
-
-    # in-month deltas (reported Fridays that fall in target month)
-    in_month = sr[pd.to_datetime(sr["date_reported"]).dt.to_period("M") == pd.Period(me, freq="M")].copy()
-    inj = float(in_month[in_month["delta_week_bcf"] > 0]["delta_week_bcf"].sum())
-    wd = float(-in_month[in_month["delta_week_bcf"] < 0]["delta_week_bcf"].sum())
-
-    # gap from last reported Friday → month end
-    last_fri = _last_reported_friday(sr, asof)
-    gap_days = max((me - last_fri).days, 0)
-
-    est = BlendedEstimator(
-        weights={"A": weights[0], "B": weights[1], "C": weights[2]},
-        mA=MethodA(),
-        mB=MethodB(),
-        mC=MethodC(),
-    )
-    gap_delta = est.estimate_gap(weekly_silver, asof=asof, region=region, stratum=stratum)
-    end_est = beg + inj - wd + gap_delta
-
-    return pd.DataFrame(
-        [{
-            "month_end": me,
-            "region": region,
-            "stratum": (stratum or "none"),
-            "beg_working_gas_bcf": beg,
-            "est_injections_bcf": inj,
-            "est_withdrawals_bcf": wd,
-            "gap_delta_bcf": gap_delta,
-            "gap_days": gap_days,
-            "end_working_gas_bcf": end_est,
-        }]
+    """Monthly rollforward for every (region, stratum) in ``weekly_silver``.
+
+    One row per key, computed with grouped aggregations over the whole frame
+    instead of a per-key loop; :func:`build_monthly_rollforward` is this on a
+    single key's rows. The beginning balance is the key's latest reading on or
+    before the cutoff, NaN if that reading is NaN (it does not reach back to an
+    older one), and 0.0 for a key with no rows that early.
+
+    A prebuilt ``estimator`` (see :func:`build_estimator`) replaces the one
+    otherwise built from ``weights``, ``lookback_weeks`` and ``ops_path``.
+    """
+    if weekly_silver.empty:
+        return _EMPTY.copy()
+    p = prepare_weekly(weekly_silver, asof)
+    w, d, me, idx = p.w, p.d, p.month_end, p.idx
+    # Beginning-balance cutoff. MonthBegin(1) back from a month end lands on
+    # that month's 1st, so the cutoff has always been me itself; plain date
+    # arithmetic now, no Timestamp/offset round trip
+    prev_me = month_end_date(me.replace(day=1))
+    delta = w["delta_week_bcf"]
+    keys = [w["region"], w["stratum"]]
+
+    # beginning = last month-end working_gas: rows are sorted by key then
+    # date, so it is the last row of each key's run of rows on or before
+    # prev_me, NaN included; no groupby
+    codes = [k.cat.codes.to_numpy() for k in keys]
+    pos = np.flatnonzero((d <= pd.Timestamp(prev_me)).to_numpy() & (codes[0] >= 0) & (codes[1] >= 0))
+    _, ends = _run_bounds([c[pos] for c in codes])
+    last = w["working_gas_bcf"].to_numpy(dtype=np.float64)[pos[ends]]
+    beg = pd.Series(last, index=pd.MultiIndex.from_arrays([k.iloc[pos[ends]] for k in keys])).reindex(idx, fill_value=0.0)
+
+    # in-month deltas (reported Fridays that fall in target month); a range
+    # check on the timestamps rather than extracting year and month fields
+    in_month = (d >= pd.Timestamp(me.replace(day=1))) & (d < pd.Timestamp(me + dt.timedelta(days=1)))
+    # Positive and negative parts are summed together, one reduceat over each
+    # key's run of rows (NaN deltas count as 0, as GroupBy.sum skips them)
+    pos = np.flatnonzero(in_month.to_numpy() & (codes[0] >= 0) & (codes[1] >= 0))
+    dm = delta.to_numpy(dtype=np.float64)[pos]
+    starts, _ = _run_bounds([c[pos] for c in codes])
+    parts = np.column_stack([np.where(dm > 0, dm, 0.0), np.where(dm < 0, dm, 0.0)])
+    sums = np.add.reduceat(parts, starts, axis=0) if pos.size else parts
+    flows = pd.DataFrame(sums, columns=["inj", "wd"],
+                         index=pd.MultiIndex.from_arrays([k.iloc[pos[starts]] for k in keys])).reindex(idx, fill_value=0.0)
+    inj, wd = flows["inj"], -flows["wd"]
+
+    # gap from last reported Friday → month end, blended across Methods A/B/C
+    gap_days = p.gap_days
+    blend = estimator or build_estimator(weights, lookback_weeks, ops_path)
+    gap_delta = blend.estimate_gap_batch(p)
+
+    # Columns are handed over as arrays already in their output dtype; the
+    # panel's categorical keys are decoded back to the input's string dtype
+    region, stratum = (idx.get_level_values(k) for k in ("region", "stratum"))
+    cols = {"beg_working_gas_bcf": beg, "est_injections_bcf": inj, "est_withdrawals_bcf": wd,
+            "gap_delta_bcf": gap_delta, "gap_days": gap_days, "end_working_gas_bcf": beg + inj - wd + gap_delta}
+    return pd.DataFrame({
+        "month_end": np.full(len(idx), me, dtype=object),
+        "region": region.astype(region.categories.dtype).array,
+        "stratum": stratum.astype(stratum.categories.dtype).array,
+        **{c: sr.to_numpy(dtype=_ROLL_DTYPES[c]) for c, sr in cols.items()},
+    }, copy=False)
+
+_HISTORY_COLS = ["month_end", "region", "stratum", "beg_working_gas_bcf", "est_injections_bcf",
+                 "est_withdrawals_bcf", "last_working_gas_bcf", "last_reported"]
+
+def build_monthly_history(weekly_silver: pd.DataFrame) -> pd.DataFrame:
+    """Reported monthly figures for every (region, stratum) and month.
+
+    One grouped aggregation over the whole history, instead of a
+    :func:`build_monthly_rollforward_all` call per month: in-month injections
+    and withdrawals, the month's last reading (NaN if that reading is NaN)
+    and report date, and the beginning balance carried from the key's
+    previous reported month (NaN for its first). No gap estimate is applied; that depends on an as-of date.
+    """
+    if weekly_silver.empty:
+        return pd.DataFrame(columns=_HISTORY_COLS)
+    d = pd.to_datetime(weekly_silver["date_reported"]).astype("datetime64[ns]")
+    delta = weekly_silver["delta_week_bcf"]
+    w = pd.DataFrame({
+        "region": weekly_silver["region"].astype("category"),
+        "stratum": fill_stratum(weekly_silver["stratum"]).astype("category"),
+        "month": d.dt.to_period("M"),
+        "date": d,
+        "inj": delta.clip(lower=0.0),
+        "wd": -delta.clip(upper=0.0),
+        "wg": weekly_silver["working_gas_bcf"],
+    }).sort_values(["region", "stratum", "date"], kind="stable")
+    # Position of each row after the sort; a month's last reading is the row
+    # at its largest position, NaN included ("last" would skip a NaN reading)
+    w["row"] = np.arange(len(w))
+    agg = w.groupby(["region", "stratum", "month"], observed=True).agg(
+        est_injections_bcf=("inj", "sum"),
+        est_withdrawals_bcf=("wd", "sum"),
+        last_row=("row", "max"),
+        last_reported=("date", "max"),
     )
+    agg["last_working_gas_bcf"] = w["wg"].to_numpy(dtype=np.float64)[agg.pop("last_row").to_numpy()]
+    # Carry-forward: each month begins at the key's previous month's last reading
+    agg["beg_working_gas_bcf"] = agg.groupby(level=["region", "stratum"], observed=True)["last_working_gas_bcf"].shift(1)
+    agg = agg.reset_index()
+    agg["month_end"] = agg.pop("month").dt.end_time.dt.date
+    for k in ("region", "stratum"):
+        agg[k] = agg[k].astype(agg[k].cat.categories.dtype)
+    return agg[_HISTORY_COLS]
+
+def _key_mask(s: pd.Series, value: str, missing: bool = False) -> np.ndarray:
+    # Rows whose key equals value (or is missing, when missing=True). A
+    # categorical column is compared on its integer codes.
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        cats = s.cat.categories
+        mask = codes == cats.get_loc(value) if value in cats else np.zeros(len(s), dtype=bool)
+        return mask | (codes == -1) if missing else mask
+    arr = s.to_numpy(dtype=object)
+    return (arr == value) | pd.isna(arr) if missing else arr == value
+
+def build_rollforward_index(weekly_silver: pd.DataFrame) -> dict[tuple[str, str], np.ndarray]:
+    """Row positions of every (region, stratum) key in ``weekly_silver``.
+
+    Missing strata are keyed as ``"none"``. Build it once and pass it as
+    ``index=`` to repeated :func:`build_monthly_rollforward` calls over the
+    same frame; each call then slices its rows instead of re-filtering.
+    """
+    strata = weekly_silver["stratum"].to_numpy(dtype=object)
+    strata = np.where(pd.isna(strata), "none", strata)
+    region = weekly_silver["region"].to_numpy(dtype=object)
+    return weekly_silver.groupby([region, strata], sort=False).indices
+
+def build_monthly_rollforward(
+    weekly_silver: pd.DataFrame,
+    asof: dt.date,
+    weights: tuple[float, float, float] = (0.3, 0.2, 0.5),
+    region: str = "US",
+    stratum: str | None = None,
+    index: dict[tuple[str, str], np.ndarray] | None = None,
+    estimator: BlendedEstimator | None = None,
+) -> pd.DataFrame:
+    stratum = stratum or "none"
+    if index is not None:
+        # Positions from build_rollforward_index(weekly_silver)
+        pos = index.get((region, stratum))
+        sr = weekly_silver.iloc[pos] if pos is not None else weekly_silver.iloc[:0]
+    else:
+        # One boolean mask over the key columns; a missing stratum matches "none"
+        mask = _key_mask(weekly_silver["region"], region)
+        mask &= _key_mask(weekly_silver["stratum"], stratum, missing=stratum == "none")
+        sr = weekly_silver[mask]
+    if sr.empty:
+        raise ValueError(f"no weekly rows for region={region!r} stratum={stratum!r}")
+    # estimator: a build_estimator() result shared across calls; weights are
+    # then ignored
+    return build_monthly_rollforward_all(sr, asof, weights=weights, estimator=estimator)
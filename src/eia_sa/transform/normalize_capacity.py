@@ -1,8 +1,13 @@
 from __future__ import annotations
 import pandas as pd
+from eia_sa.utils.parquet_io import read_parquet_columns
+
+# Raw columns normalize_capacity can use, under either name
+_CAPACITY_SOURCE_COLS = ("area", "region", "stratum", "year", "working_capacity", "working_capacity_bcf",
+                         "design_capacity", "design_capacity_bcf")
 
 def normalize_capacity(raw_parquet: str) -> pd.DataFrame:
-    df = pd.read_parquet(raw_parquet)
+    df = read_parquet_columns(raw_parquet, _CAPACITY_SOURCE_COLS)
     df = df.rename(columns={
         "area":"region",
         "working_capacity":"working_capacity_bcf",
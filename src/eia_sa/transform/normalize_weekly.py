@@ -1,25 +1,71 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from eia_sa.accrual.methods import fill_stratum
+from eia_sa.utils.parquet_io import read_parquet_columns, read_parquet_schema
+
+# Every raw column normalize_weekly can use, under any of its EIA aliases
+_WEEKLY_SOURCE_COLS = ("period", "date", "date_reported", "value", "working_gas_bcf", "area", "region", "stratum")
+
+# Silver columns and the Arrow types normalize_weekly writes them as
+_SILVER_TYPES = {
+    "date_reported": pa.types.is_timestamp,
+    "region": pa.types.is_dictionary,
+    "stratum": pa.types.is_dictionary,
+    "working_gas_bcf": pa.types.is_floating,
+    "delta_week_bcf": pa.types.is_floating,
+}
+
+def _is_silver(schema: pa.Schema) -> bool:
+    return all(name in schema.names and is_type(schema.field(name).type) for name, is_type in _SILVER_TYPES.items())
 
 def _rename_cols(df: pd.DataFrame, mapping: dict[str,str]) -> pd.DataFrame:
     present = {k:v for k,v in mapping.items() if k in df.columns}
     return df.rename(columns=present)
 
+def _grouped_diff(x: np.ndarray, *keys: pd.Series) -> np.ndarray:
+    # Row-to-row change within runs of equal keys, on rows already sorted by
+    # those keys: one vectorized pass instead of a groupby. The first row of a
+    # run, rows with a missing key, and NaN differences all get 0.0.
+    out = np.zeros_like(x)
+    if x.size > 1:
+        same = np.ones(x.size - 1, dtype=bool)
+        for k in keys:
+            codes = pd.factorize(k)[0]  # missing -> -1
+            same &= (codes[1:] == codes[:-1]) & (codes[1:] >= 0)
+        out[1:] = np.where(same, x[1:] - x[:-1], 0.0)
+        out[np.isnan(out)] = 0.0
+    return out
+
 def normalize_weekly(raw_parquet: str) -> pd.DataFrame:
-    df = pd.read_parquet(raw_parquet)
+    if _is_silver(read_parquet_schema(raw_parquet)):
+        # Already normalized (a re-run over silver output): read it back
+        # instead of renaming, re-sorting and re-differencing
+        df = read_parquet_columns(raw_parquet, _SILVER_TYPES)
+        df["stratum"] = fill_stratum(df["stratum"])
+        return df
+    df = read_parquet_columns(raw_parquet, _WEEKLY_SOURCE_COLS)
     # try common EIA shapes
     df = _rename_cols(df, {"period":"date","value":"working_gas_bcf","area":"region"})
     if "working_gas_bcf" not in df.columns and "value" in df.columns:
         df["working_gas_bcf"] = df["value"]
     if "date_reported" not in df.columns:
         base_date_col = "date" if "date" in df.columns else "period"
-        df["date_reported"] = pd.to_datetime(df[base_date_col]).dt.date
+        # Kept as datetime64 (midnight) rather than dt.date objects, so the
+        # sort here and the date handling downstream stay vectorized
+        df["date_reported"] = pd.to_datetime(df[base_date_col]).dt.normalize()
     if "region" not in df.columns:
         raise ValueError(f"normalize_weekly: missing 'region' column. got {df.columns.tolist()}")
     if "stratum" not in df.columns:
         df["stratum"] = "none"
-    df = df.sort_values(["region","stratum","date_reported"])
-    df["delta_week_bcf"] = df.groupby(["region","stratum"])["working_gas_bcf"].diff().fillna(0.0)
+    # Categorical keys: the sort, the grouped diff and later key filters compare
+    # integer codes, not strings (categories are ordered lexically). A missing
+    # stratum is "none", as everywhere downstream.
+    df["region"] = df["region"].astype("category")
+    df["stratum"] = fill_stratum(df["stratum"]).astype("category")
+    df = df.sort_values(["region","stratum","date_reported"], kind="mergesort")
+    df["delta_week_bcf"] = _grouped_diff(df["working_gas_bcf"].to_numpy(dtype=np.float64), df["region"], df["stratum"])
     keep = ["date_reported","region","stratum","working_gas_bcf","delta_week_bcf"]
     keep = [c for c in keep if c in df.columns]
     return df[keep]
@@ -1,8 +1,54 @@
 from __future__ import annotations
 import pandas as pd
+import pyarrow as pa
+import xlsxwriter
 from pathlib import Path
 from datetime import datetime
 
+# constant_memory flushes each row to disk once a later row is started, so
+# peak memory stays at one row per sheet. Strings are written as-is.
+_WORKBOOK_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_numbers": False,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+    "default_date_format": "YYYY-MM-DD",
+}
+
+def _is_timestamp(s: pd.Series) -> bool:
+    if isinstance(s.dtype, pd.ArrowDtype):
+        return pa.types.is_timestamp(s.dtype.pyarrow_dtype)
+    return pd.api.types.is_datetime64_any_dtype(s.dtype)
+
+def _write_sheet(wb: xlsxwriter.Workbook, name: str, df: pd.DataFrame, fmts: dict) -> None:
+    # Row by row, as constant_memory requires (DataFrame.to_excel writes
+    # column by column, and so would write_column). Each column is boxed to
+    # Python scalars once, with missing values as None (left empty), and the
+    # rows are zipped from those lists.
+    ws = wb.add_worksheet(name)
+    ws.write_row(0, 0, [str(c) for c in df.columns], fmts["header"])
+    cols = []
+    for _, s in df.items():
+        v = s.to_numpy(dtype=object)
+        missing = pd.isna(v)
+        if missing.any():
+            v[missing] = None
+        cols.append(v.tolist())
+    # Timestamp columns keep their time of day, as to_excel shows them; the
+    # rest of the dates take the workbook's date format
+    ts_cols = [j for j, c in enumerate(df.columns) if _is_timestamp(df[c])]
+    for r, row in enumerate(zip(*cols, strict=True), start=1):
+        ws.write_row(r, 0, row)
+        for j in ts_cols:
+            if row[j] is not None:
+                ws.write_datetime(r, j, row[j], fmts["datetime"])
+
+def _write_record(wb: xlsxwriter.Workbook, name: str, record: dict, fmts: dict) -> None:
+    # A one-row sheet straight from a dict: keys as the header, values below
+    ws = wb.add_worksheet(name)
+    ws.write_row(0, 0, [str(k) for k in record], fmts["header"])
+    ws.write_row(1, 0, list(record.values()))
+
 def write_close_pack(
     rollforward: pd.DataFrame,
     kpis: pd.DataFrame,
@@ -11,12 +57,15 @@ def write_close_pack(
     out_path: str = "outputs/monthly_close_pack.xlsx",
 ) -> str:
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    with pd.ExcelWriter(out_path, engine="xlsxwriter") as xl:
-        rollforward.to_excel(xl, sheet_name="Rollforward", index=False)
-        kpis.to_excel(xl, sheet_name="KPIs", index=False)
-        accruals.to_excel(xl, sheet_name="Accruals", index=False)
-        pd.DataFrame([assumptions]).to_excel(xl, sheet_name="Assumptions", index=False)
-        pd.DataFrame([{"generated_at": datetime.utcnow().isoformat() + "Z"}]).to_excel(
-            xl, sheet_name="Audit_Log", index=False
-        )
+    sheets = {"Rollforward": rollforward, "KPIs": kpis, "Accruals": accruals}
+    with xlsxwriter.Workbook(str(out_path), _WORKBOOK_OPTIONS) as wb:
+        # Same header and timestamp styles as DataFrame.to_excel
+        fmts = {
+            "header": wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"}),
+            "datetime": wb.add_format({"num_format": "YYYY-MM-DD HH:MM:SS"}),
+        }
+        for name, df in sheets.items():
+            _write_sheet(wb, name, df, fmts)
+        _write_record(wb, "Assumptions", assumptions, fmts)
+        _write_record(wb, "Audit_Log", {"generated_at": datetime.utcnow().isoformat() + "Z"}, fmts)
     return out_path
@@ -3,17 +3,21 @@
 from __future__ import annotations
 import logging
 import os
+from functools import lru_cache
 
-# Try to read log level from env or (optionally) config, but don't fail if missing.
-_LEVEL = os.getenv("EIA_SA_LOG_LEVEL", "INFO").upper()
-try:
-    from eia_sa.config import get_settings
-    _cfg = get_settings()
-    lvl = getattr(_cfg, "log_level", None)
-    if isinstance(lvl, str):
-        _LEVEL = lvl.upper()
-except Exception:
-    pass
+@lru_cache(maxsize=1)
+def _level() -> str:
+    # Log level from env or (optionally) config, but don't fail if missing.
+    # Resolved on first use, so importing this module never loads settings.
+    level = os.getenv("EIA_SA_LOG_LEVEL", "INFO").upper()
+    try:
+        from eia_sa.config import get_settings
+        lvl = getattr(get_settings(), "log_level", None)
+        if isinstance(lvl, str):
+            level = lvl.upper()
+    except Exception:
+        pass
+    return level
 
 def _configure_root() -> logging.Logger:
     logger = logging.getLogger("eia_sa")
@@ -22,33 +26,44 @@ def _configure_root() -> logging.Logger:
         fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s - %(message)s")
         h.setFormatter(fmt)
         logger.addHandler(h)
-    logger.setLevel(_LEVEL)
+    logger.setLevel(_level())
     return logger
 
-_root = _configure_root()
+# Configured by the first get_logger() call
+_root: logging.Logger | None = None
+
+def setup_logging(level: str | None = None) -> logging.Logger:
+    """Configure the ``eia_sa`` logger; safe to call more than once."""
+    global _root
+    logger = _root = _configure_root()
+    if level:
+        logger.setLevel(level.upper())
+    return logger
 
 def get_logger(name: str | None = None) -> logging.Logger:
+    global _root
+    if _root is None:
+        _root = _configure_root()
     return _root if not name else logging.getLogger(f"eia_sa.{name}")
 
 
+# The helpers below build ``extra=`` payloads. They carry no timestamp of
+# their own: every LogRecord already has one (``created``, ``%(asctime)s``).
+
 def log_function_call(func_name: str, **kwargs: Any) -> Dict[str, Any]:
     """Create a standardized log context for function calls."""
-    from datetime import datetime
     return {
         "function": func_name,
         "parameters": kwargs,
-        "timestamp": datetime.now().isoformat(),
     }
 
 
 def log_api_request(endpoint: str, status_code: int, response_time: float, **kwargs: Any) -> Dict[str, Any]:
     """Create a standardized log context for API requests."""
-    from datetime import datetime
     return {
         "api_endpoint": endpoint,
         "status_code": status_code,
         "response_time_ms": round(response_time * 1000, 2),
-        "timestamp": datetime.now().isoformat(),
         **kwargs,
     }
 
@@ -60,12 +75,10 @@ def log_data_processing(
     **kwargs: Any
 ) -> Dict[str, Any]:
     """Create a standardized log context for data processing."""
-    from datetime import datetime
     return {
         "data_layer": layer,
         "record_count": record_count,
         "processing_time_ms": round(processing_time * 1000, 2),
-        "timestamp": datetime.now().isoformat(),
         **kwargs,
     }
 
@@ -81,6 +94,5 @@ def log_accrual_calculation(
         "month_end": month_end,
         "region": region,
         "total_accrual": round(total_accrual, 2),
-        "timestamp": datetime.now().isoformat(),
         **kwargs,
     }
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Large row groups for the weekly/bronze tables; anything smaller (all the
+# monthly gold outputs) is written as a single row group.
+PARQUET_ROW_GROUP_SIZE = 256_000
+
+def write_parquet(data: pd.DataFrame | pa.Table, path: str | os.PathLike[str], row_group_size: int = PARQUET_ROW_GROUP_SIZE) -> pa.Table:
+    # Single file via pyarrow: zstd level 3, dictionary pages, 1 MiB data
+    # pages, statistics on, and no _metadata sidecar. One open ParquetWriter
+    # cuts the table into row-group-sized slices, so pages are flushed in
+    # large chunks regardless of how the table is chunked in memory. Returns
+    # the Arrow table written so callers can reuse it.
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    rows = min(row_group_size, max(table.num_rows, 1))
+    with pq.ParquetWriter(
+        path, table.schema,
+        compression="zstd", compression_level=3,
+        data_page_size=1 << 20, use_dictionary=True, write_statistics=True,
+    ) as writer:
+        writer.write_table(table, row_group_size=rows)
+    return table
+
+def read_parquet_columns(path: str | os.PathLike[str], columns: Sequence[str]) -> pd.DataFrame:
+    # Reads only those of ``columns`` the file (or hive-partitioned dataset
+    # directory) has; the rest are never decoded. Schema comes from the footer.
+    import pyarrow.dataset as ds
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    names = set(dataset.schema.names)
+    return dataset.to_table(columns=[c for c in columns if c in names]).to_pandas()
+
+def read_parquet_schema(path: str | os.PathLike[str]) -> pa.Schema:
+    # Schema of a file or hive-partitioned directory, from the footer alone
+    import pyarrow.dataset as ds
+    return ds.dataset(path, format="parquet", partitioning="hive").schema
@@ -6,9 +6,25 @@ Test script to explore EIA API endpoints
 import requests
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def test_endpoint(endpoint, api_key):
+def make_session():
+    """One pooled session for the whole sweep, so the TLS handshake is paid once"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    return session
+
+def test_endpoint(endpoint, api_key, session=None):
     """Test a specific API endpoint"""
+    session = session or requests
+    # Lines are collected and printed together, so concurrent sweeps don't
+    # interleave their output
+    out = []
+    say = out.append
     base_url = "https://api.eia.gov/v2"
     url = f"{base_url}/{endpoint}"
     
@@ -25,42 +41,44 @@ def test_endpoint(endpoint, api_key):
     }
     
     try:
-        print(f"\n🔍 Testing endpoint: {endpoint}")
-        print(f"   URL: {url}")
+        say(f"\n🔍 Testing endpoint: {endpoint}")
+        say(f"   URL: {url}")
         
-        response = requests.get(url, params=params)
-        print(f"   Status: {response.status_code}")
+        response = session.get(url, params=params, timeout=30)
+        say(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
             data = response.json()
-            print(f"   Response keys: {list(data.keys())}")
+            say(f"   Response keys: {list(data.keys())}")
             
             if 'response' in data:
                 response_data = data['response']
-                print(f"   Response data keys: {list(response_data.keys())}")
+                say(f"   Response data keys: {list(response_data.keys())}")
                 
                 if 'data' in response_data:
                     df_data = response_data['data']
-                    print(f"   ✅ Success! Found {len(df_data)} data points")
+                    say(f"   ✅ Success! Found {len(df_data)} data points")
                     if df_data:
-                        print(f"   📋 Sample data structure:")
-                        print(f"      Keys: {list(df_data[0].keys())}")
-                        print(f"      First record: {df_data[0]}")
+                        say(f"   📋 Sample data structure:")
+                        say(f"      Keys: {list(df_data[0].keys())}")
+                        say(f"      First record: {df_data[0]}")
                     return True
                 else:
-                    print(f"   ❌ No 'data' key in response")
+                    say(f"   ❌ No 'data' key in response")
                     return False
             else:
-                print(f"   ❌ No 'response' key in data")
+                say(f"   ❌ No 'response' key in data")
                 return False
         else:
-            print(f"   ❌ Error: {response.status_code}")
-            print(f"      Response: {response.text[:200]}...")
+            say(f"   ❌ Error: {response.status_code}")
+            say(f"      Response: {response.text[:200]}...")
             return False
             
     except Exception as e:
-        print(f"   ❌ Exception: {e}")
+        say(f"   ❌ Exception: {e}")
         return False
+    finally:
+        print("\n".join(out))
 
 def main():
     """Test various EIA API endpoints"""
@@ -73,10 +91,11 @@ def main():
     print("🔋 EIA API Endpoint Testing")
     print("=" * 50)
     print(f"API Key: {api_key[:10]}...")
+    s = make_session()
     
     # Test the exact endpoint from user's example
     print("\n🎯 Testing User's Exact Endpoint...")
-    test_endpoint("natural-gas/stor/wkly", api_key)
+    test_endpoint("natural-gas/stor/wkly", api_key, session=s)
     
     # Test some other endpoints to see what works
     print("\n🔍 Testing Other Endpoints...")
@@ -91,10 +110,10 @@ def main():
         "total-energy"
     ]
     
-    working_endpoints = []
-    for endpoint in endpoints_to_test:
-        if test_endpoint(endpoint, api_key):
-            working_endpoints.append(endpoint)
+    # Independent network-bound calls: run them concurrently on the shared session
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(lambda e: (e, test_endpoint(e, api_key, session=s)), endpoints_to_test))
+    working_endpoints = [endpoint for endpoint, ok in results if ok]
     
     print(f"\n📊 Summary:")
     print(f"   Working endpoints: {len(working_endpoints)}")
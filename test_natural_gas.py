@@ -3,11 +3,13 @@
 Test script for natural gas storage data from EIA API
 """
 
+import logging
 from eia_analysis import EIAEnergyAnalyzer
 import os
 
 def main():
     """Test natural gas storage data retrieval"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🔋 Natural Gas Storage Data Test")
     print("=" * 50)
     
@@ -0,0 +1,63 @@
+"""Batch accrual path checked against per-row calc_accruals."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eia_sa.accrual.calculator import AccrualInputs, calc_accruals, calc_accruals_batch
+
+
+def _rolls() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "month_end": ["2024-06-30", "2024-07-31", "2024-07-31"],
+            "region": ["US", "US", "East"],
+            "stratum": ["none", "none", "salt"],
+            "end_working_gas_bcf": [2950.5, np.nan, 812.25],
+            "est_injections_bcf": [67.9, 12.0, 0.0],
+            "est_withdrawals_bcf": [-0.0, 3.5, 4.25],
+        }
+    )
+
+
+def test_calc_accruals_batch_matches_per_row():
+    rolls = _rolls()
+    inputs = [
+        AccrualInputs(
+            wacog_per_mmbtu=3.25,
+            tariff_fixed_monthly=120_000.0,
+            tariff_injection_per_mmbtu=0.02,
+            tariff_withdrawal_per_mmbtu=0.03,
+        ),
+        AccrualInputs(
+            wacog_per_mmbtu=2.9,
+            scenario_band=0.2,
+            penalty_probability=0.5,
+            penalty_amount=1000.0,
+        ),
+        AccrualInputs(wacog_per_mmbtu=3.1, bcf_to_mmbtu_factor=1_030_000.0),
+    ]
+    got = calc_accruals_batch(rolls, inputs)
+    expected = pd.concat(
+        [calc_accruals(rolls.iloc[[i]], ai) for i, ai in enumerate(inputs)]
+    )
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-12)
+    # A missing end balance carries through to the accrual rather than being filled
+    assert np.isnan(got.loc[1, "total_accrual_base"])
+    with pytest.raises(ValueError):
+        calc_accruals_batch(rolls, inputs[:2])
+
+
+def test_calc_accruals_multi_row_matches_single_rows():
+    rolls = _rolls()
+    ai = AccrualInputs(
+        wacog_per_mmbtu=3.25,
+        tariff_fixed_monthly=120_000.0,
+        tariff_withdrawal_per_mmbtu=0.03,
+    )
+    expected = pd.concat(
+        [calc_accruals(rolls.iloc[[i]], ai) for i in range(len(rolls))]
+    )
+    pd.testing.assert_frame_equal(
+        calc_accruals(rolls, ai), expected, check_exact=False, rtol=1e-12
+    )
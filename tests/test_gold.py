@@ -0,0 +1,217 @@
+"""Grouped gold/estimator paths checked against the per-key computations."""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eia_sa.accrual.methods import (
+    BlendedEstimator,
+    MethodA,
+    MethodB,
+    MethodC,
+    prepare_weekly,
+)
+from eia_sa.transform.build_gold import (
+    build_estimator,
+    build_monthly_history,
+    build_monthly_rollforward,
+    build_monthly_rollforward_all,
+    build_rollforward_index,
+)
+
+ASOF = dt.date(2024, 7, 9)
+KEYS = [("US", None), ("East", "salt"), ("East", "nonsalt"), ("Pacific", None)]
+
+
+def _weekly() -> pd.DataFrame:
+    dates = pd.date_range("2024-04-05", "2024-07-26", freq="7D")
+    rng = np.random.default_rng(0)
+    frames = []
+    for region, stratum in KEYS:
+        if region == "Pacific":
+            # No rows on or before the beginning-balance cutoff
+            d = pd.date_range("2024-08-02", periods=3, freq="7D")
+        else:
+            d = dates
+        wg = rng.normal(3000, 50, len(d))
+        if stratum == "salt":
+            wg[d.get_indexer([pd.Timestamp("2024-07-26")])] = (
+                np.nan
+            )  # latest reading missing
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date_reported": d,
+                    "region": region,
+                    "stratum": stratum,
+                    "working_gas_bcf": wg,
+                    "delta_week_bcf": rng.normal(0, 20, len(d)),
+                }
+            )
+        )
+    w = pd.concat(frames, ignore_index=True)
+    w.loc[5, "delta_week_bcf"] = np.nan
+    # Shuffled: nothing may rely on input order
+    return w.sample(frac=1.0, random_state=1).reset_index(drop=True)
+
+
+def _ops(tmp_path) -> str:
+    path = tmp_path / "ops.csv"
+    pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2024-07-15", "2024-07-29", "2024-07-30", "2024-08-05"]
+            ),
+            "region": ["US", "US", "East", "US"],
+            "stratum": [None, None, "salt", None],
+            "inj_bcf": [1.0, 2.0, 3.0, 4.0],
+            "wd_bcf": [0.5, np.nan, 1.0, 0.0],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+def _expected_row(
+    w: pd.DataFrame, region: str, stratum, asof: dt.date, est: BlendedEstimator
+) -> dict:
+    # Straightforward per-key rollforward on plain pandas
+    sr = w[
+        (w["region"] == region) & (w["stratum"].fillna("none") == (stratum or "none"))
+    ].sort_values("date_reported")
+    me = (pd.Timestamp(asof) + pd.offsets.MonthEnd(0)).date()
+    before = sr[sr["date_reported"] <= pd.Timestamp(me)]
+    beg = float(before["working_gas_bcf"].iloc[-1]) if len(before) else 0.0
+    in_month = sr[sr["date_reported"].dt.to_period("M") == pd.Period(me, freq="M")][
+        "delta_week_bcf"
+    ]
+    inj = float(in_month[in_month > 0].sum())
+    wd = float(-in_month[in_month < 0].sum())
+    reported = sr[sr["date_reported"] <= pd.Timestamp(asof)]["date_reported"]
+    gap_days = max((me - reported.max().date()).days, 0) if len(reported) else 0
+    gap = est.estimate_gap(w, asof, region, stratum)
+    return {
+        "month_end": me,
+        "region": region,
+        "stratum": stratum or "none",
+        "beg_working_gas_bcf": beg,
+        "est_injections_bcf": inj,
+        "est_withdrawals_bcf": wd,
+        "gap_delta_bcf": gap,
+        "gap_days": gap_days,
+        "end_working_gas_bcf": beg + inj - wd + gap,
+    }
+
+
+def test_rollforward_all_matches_per_key(tmp_path):
+    w = _weekly()
+    est = build_estimator(ops_path=_ops(tmp_path))
+    got = build_monthly_rollforward_all(w, ASOF, estimator=est).set_index(
+        ["region", "stratum"]
+    )
+    assert len(got) == len(KEYS)
+    for region, stratum in KEYS:
+        exp = _expected_row(w, region, stratum, ASOF, est)
+        row = got.loc[(region, stratum or "none")]
+        for col, value in exp.items():
+            if col in ("region", "stratum"):
+                continue
+            if isinstance(value, float):
+                np.testing.assert_allclose(
+                    row[col], value, rtol=1e-12, atol=1e-9, err_msg=col
+                )
+            else:
+                assert row[col] == value, col
+
+
+def test_rollforward_beginning_balance_edge_cases():
+    got = build_monthly_rollforward_all(_weekly(), ASOF).set_index(
+        ["region", "stratum"]
+    )
+    # Latest reading before the cutoff is NaN: no reaching back to an older one
+    assert np.isnan(got.loc[("East", "salt"), "beg_working_gas_bcf"])
+    assert np.isnan(got.loc[("East", "salt"), "end_working_gas_bcf"])
+    # No rows on or before the cutoff: starts from zero
+    assert got.loc[("Pacific", "none"), "beg_working_gas_bcf"] == 0.0
+
+
+def test_single_key_rollforward_matches_all():
+    w = _weekly()
+    everything = build_monthly_rollforward_all(w, ASOF)
+    index = build_rollforward_index(w)
+    for region, stratum in KEYS:
+        key = (everything["region"] == region) & (
+            everything["stratum"] == (stratum or "none")
+        )
+        expected = everything[key].reset_index(drop=True)
+        for kwargs in ({}, {"index": index}):
+            got = build_monthly_rollforward(
+                w, ASOF, region=region, stratum=stratum, **kwargs
+            )
+            pd.testing.assert_frame_equal(got, expected)
+    with pytest.raises(ValueError):
+        build_monthly_rollforward(w, ASOF, region="Nowhere")
+
+
+@pytest.mark.parametrize(
+    "estimator", [MethodA(), MethodA(lookback_weeks=2), MethodB(), "C", "blend"]
+)
+def test_estimate_gap_batch_matches_per_key(tmp_path, estimator):
+    w = _weekly()
+    ops_path = _ops(tmp_path)
+    if estimator == "C":
+        estimator = MethodC(ops_path)
+    elif estimator == "blend":
+        estimator = BlendedEstimator(
+            {"A": 0.3, "B": 0.2, "C": 0.5}, MethodA(), MethodB(), MethodC(ops_path)
+        )
+    batch = estimator.estimate_gap_batch(prepare_weekly(w, ASOF))
+    for region, stratum in KEYS:
+        np.testing.assert_allclose(
+            batch.loc[(region, stratum or "none")],
+            estimator.estimate_gap(w, ASOF, region, stratum),
+            rtol=1e-12,
+            atol=1e-12,
+        )
+
+
+@pytest.mark.parametrize(("region", "stratum"), [("US", None), ("East", "salt")])
+def test_monthly_history_matches_per_key_months(region, stratum):
+    w = _weekly()
+    hist = build_monthly_history(w)
+    sr = w[
+        (w["region"] == region) & (w["stratum"].fillna("none") == (stratum or "none"))
+    ].sort_values("date_reported")
+    months = sr["date_reported"].dt.to_period("M")
+    got = hist[
+        (hist["region"] == region) & (hist["stratum"] == (stratum or "none"))
+    ].reset_index(drop=True)
+    assert list(got["month_end"]) == [m.end_time.date() for m in months.unique()]
+    for i, (_, g) in enumerate(sr.groupby(months)):
+        d = g["delta_week_bcf"]
+        assert got.loc[i, "est_injections_bcf"] == pytest.approx(d[d > 0].sum())
+        assert got.loc[i, "est_withdrawals_bcf"] == pytest.approx(-d[d < 0].sum())
+        assert got.loc[i, "last_reported"] == g["date_reported"].max()
+        # The month's final row, even when its reading is NaN
+        np.testing.assert_array_equal(
+            got.loc[i, "last_working_gas_bcf"], g["working_gas_bcf"].iloc[-1]
+        )
+    # Each month begins at the previous month's last reading
+    assert np.isnan(got.loc[0, "beg_working_gas_bcf"])
+    np.testing.assert_array_equal(
+        got["beg_working_gas_bcf"].iloc[1:], got["last_working_gas_bcf"].iloc[:-1]
+    )
+
+
+def test_monthly_history_nan_ending_month_matches_rollforward():
+    w = _weekly()
+    hist = build_monthly_history(w).set_index(["region", "stratum", "month_end"])
+    roll = build_monthly_rollforward_all(w, ASOF).set_index(["region", "stratum"])
+    july = dt.date(2024, 7, 31)
+    # East/salt's July ends on a NaN reading; history and rollforward agree on it
+    assert np.isnan(hist.loc[("East", "salt", july), "last_working_gas_bcf"])
+    np.testing.assert_array_equal(
+        hist.loc[("East", "salt", july), "last_working_gas_bcf"],
+        roll.loc[("East", "salt"), "beg_working_gas_bcf"],
+    )